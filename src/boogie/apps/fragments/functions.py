@@ -1,6 +1,7 @@
 from collections import deque
+from functools import lru_cache
 
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import get_language, ugettext_lazy as _
 from hyperpython import Blob
 from hyperpython.fragment import fragment as hp_fragment, FragmentNotFound
 
@@ -57,7 +58,19 @@ def fragment(ref, *, request=None, raises=False, **kwargs):  # noqa: C901
                 raise
     elif raises:
         raise FragmentNotFound(ref)
-    return Blob(MISSING_FRAGMENT_MSG.format(name=ref))
+    return Blob(missing_fragment_html(ref))
+
+
+def missing_fragment_html(ref):
+    """
+    Return the error message displayed in place of a missing fragment.
+    """
+    return _missing_fragment_html(ref, get_language())
+
+
+@lru_cache(maxsize=256)
+def _missing_fragment_html(ref, language):
+    return MISSING_FRAGMENT_MSG.format(name=ref)
 
 
 def invalidate_cache(name=None):
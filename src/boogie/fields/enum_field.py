@@ -129,6 +129,7 @@ def fix_renderer(renderer):
     return render
 
 
+@lru_cache(256)
 def get_choices_from_enum(enum):
     """
     Return a list of (name, verbose name) choices from an Enum type.
@@ -1,5 +1,7 @@
 import os
+import shlex
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from invoke import task
 
@@ -65,29 +67,26 @@ def clean_migrations(ctx, all=False, yes=False):
     all_migration = re.compile(r"\d{4}\w+.py")
 
     rm_list = []
-    for app in os.listdir("src"):
-        migrations_path = f"src/{app}/migrations/"
-        if os.path.exists(migrations_path):
-            migrations = os.listdir(migrations_path)
-            if "__pycache__" in migrations:
-                migrations.remove("__pycache__")
+    with os.scandir("src") as apps:
+        for app in apps:
+            migrations_path = f"src/{app.name}/migrations/"
+            if not app.is_dir() or not os.path.exists(migrations_path):
+                continue
+            with os.scandir(migrations_path) as entries:
+                migrations = [e.name for e in entries if e.name != "__pycache__"]
             if all:
                 rm_list.extend(
-                    [
-                        f"{migrations_path}{f}"
-                        for f in migrations
-                        if all_migration.fullmatch(f)
-                    ]
+                    f"{migrations_path}{f}"
+                    for f in migrations
+                    if all_migration.fullmatch(f)
                 )
             elif sorted(migrations) == ["__init__.py", "0001_initial.py"]:
-                rm_list.append(f"{migrations_path}/0001_initial.py")
+                rm_list.append(f"{migrations_path}0001_initial.py")
             else:
                 rm_list.extend(
-                    [
-                        f"{migrations_path}/{f}"
-                        for f in migrations
-                        if auto_migration.fullmatch(f)
-                    ]
+                    f"{migrations_path}{f}"
+                    for f in migrations
+                    if auto_migration.fullmatch(f)
                 )
     remove_files(rm_list, yes)
 
@@ -101,8 +100,8 @@ def remove_files(remove_files, yes):
             "REMOVING ALL MIGRATIONS IS DANGEROUS AND SHOULD ONLY BE " "USED IN TESTING"
         )
     if yes or input("Remove those files? (y/N)").lower() == "y":
-        for file in remove_files:
-            os.remove(file)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(os.remove, remove_files))
 
 
 #
@@ -149,17 +148,53 @@ def db_fake(ctx, users=True, conversations=True, admin=True, safe=False, theme=N
 #
 # Utility functions
 #
+# Commands that interact with the terminal and must run in a pty.
+PTY_COMMANDS = {"runserver", "shell", "shell_plus", "dbshell", "createsuperuser"}
+
+
 def manage(ctx, cmd, env=None, **kwargs):
     """
-    Call python manage.py in a more robust way
+    Call python manage.py in a more robust way.
+
+    If the BOOGIE_MANAGE_IN_PROCESS environment variable is "true", commands
+    that do not need a terminal and do not request extra environment
+    variables are executed in the current process with Django's
+    call_command(). This avoids paying Django's startup cost for each call,
+    but it bypasses the project's manage.py and failures raise CommandError
+    instead of invoke's UnexpectedExit.
     """
     kwargs = {k.replace("_", "-"): v for k, v in kwargs.items() if v is not False}
+    in_process = os.environ.get("BOOGIE_MANAGE_IN_PROCESS", "").lower() == "true"
+    if in_process and not env and "DJANGO_SETTINGS_MODULE" in os.environ:
+        name, *args = shlex.split(cmd)
+        if name not in PTY_COMMANDS:
+            for k, v in kwargs.items():
+                args.extend([f"--{k}"] if v is True else [f"--{k}", str(v)])
+            return call_manage(name, *args)
+
     opts = " ".join(f'--{k} {"" if v is True else v}' for k, v in kwargs.items())
     cmd = f"{python} manage.py {cmd} {opts}"
-    env = {**os.environ, **(env or {})}
-    path = env.get("PYTHONPATH", ":".join(sys.path))
-    env.setdefault("PYTHONPATH", f"src:{path}")
+    # Invoke already merges env with os.environ, so we only pass the overrides
+    env = dict(env or ())
+    if "PYTHONPATH" not in env and "PYTHONPATH" not in os.environ:
+        env["PYTHONPATH"] = "src:" + ":".join(sys.path)
     ctx.run(cmd, pty=True, env=env)
 
 
+def call_manage(name, *args):
+    """
+    Execute management command in the current process.
+    """
+    import django
+    from django.apps import apps
+    from django.core.management import call_command
+
+    if not apps.ready:
+        src = os.path.abspath("src")
+        if os.path.isdir(src) and src not in sys.path:
+            sys.path.insert(0, src)
+        django.setup()
+    call_command(name, *args)
+
+
 set_theme = lambda *args: None
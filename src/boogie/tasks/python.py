@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from invoke import task
 
@@ -17,8 +18,9 @@ def clean(ctx):
         elif os.path.basename(base) == "__pycache__":
             rm_files.extend(join(base, f) for f in files)
 
+    # Syscalls release the GIL, so removals can overlap in a thread pool.
+    # Directories are removed only after all files were unlinked.
     print("Removing compiled bytecode files")
-    for path in rm_files:
-        os.unlink(path)
-    for path in rm_dirs:
-        os.rmdir(path)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(os.unlink, rm_files))
+        list(executor.map(os.rmdir, rm_dirs))
@@ -47,7 +47,7 @@ def watch(  # noqa: C901
     changes.
     """
 
-    import time
+    import threading
     from watchdog.observers import Observer
     from watchdog.events import (
         FileSystemEventHandler,
@@ -57,13 +57,21 @@ def watch(  # noqa: C901
         FileMovedEvent,
     )
 
-    # Create the dispatch function that throttles execution so func is
-    # executed at most every poll_time seconds
+    # Create the dispatch function that debounces execution so func is
+    # executed once after poll_time seconds without new file events
     file_event = (FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent)
-    last = time.time()
+    lock = threading.Lock()
+    run_lock = threading.Lock()
+    timer = None
+
+    # Timers run in their own threads, so we serialize calls to func
+    def run(path):
+        with run_lock:
+            print(f"File modified: {path}")
+            func()
 
     def dispatch(ev):
-        nonlocal last
+        nonlocal timer
 
         if (
             ev.src_path.endswith("__")
@@ -74,11 +82,12 @@ def watch(  # noqa: C901
             return
 
         if isinstance(ev, file_event):
-            last = start = time.time()
-            time.sleep(poll_time)
-            if last == start:
-                print(f"File modified: {ev.src_path}")
-                func()
+            with lock:
+                if timer is not None:
+                    timer.cancel()
+                timer = threading.Timer(poll_time, run, (ev.src_path,))
+                timer.daemon = True
+                timer.start()
 
     # Initialize observer and mokey-match the instance dispatch method
     observer = Observer()
@@ -88,13 +97,13 @@ def watch(  # noqa: C901
     observer.start()
     name = name or func.__name__
 
-    # Starts execution loop
+    # Starts execution loop. The main thread simply blocks until interrupted.
     print(f"Running {name} in watch mode.")
     if not skip_first:
-        func()
+        with run_lock:
+            func()
     try:
-        while True:
-            time.sleep(0.5)
+        threading.Event().wait()
     except KeyboardInterrupt:
         observer.stop()
     observer.join()
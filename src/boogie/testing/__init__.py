@@ -5,4 +5,5 @@ _function = lambda x: import_later(x, package=__package__)
 
 # Lazy imports of checker functions
 check_link_errors = _function(".crawler:check_link_errors")
+find_link_errors = _function(".crawler:find_link_errors")
 factory = _function(".factories:factory")
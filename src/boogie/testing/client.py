@@ -11,14 +11,12 @@ class Client(DjangoClient):
         Makes a get request and return result as a raw string of data instead
         of the usual response object.
         """
-        response = self.get(*args, **kwargs)
-        if getattr(response, "url", None):
-            return self.get_data(response.url, fix_links=fix_links)
-
+        data = self._fetch(*args, **kwargs)
         if fix_links:
-            soup = self.get_soup(*args, fix_links=True, **kwargs)
+            soup = bs4.BeautifulSoup(data, "lxml")
+            add_href_prefix(soup, "http://localhost:8000")
             return str(soup)
-        return response.content.decode(response.charset)
+        return data
 
     def get_html(self, *args, **kwargs):
         """
@@ -33,13 +31,23 @@ class Client(DjangoClient):
         """
         Return response of a request as a Beautiful soup object.
         """
-        soup = bs4.BeautifulSoup(self.get_data(*args, **kwargs))
+        soup = bs4.BeautifulSoup(self._fetch(*args, **kwargs), "lxml")
         if fix_links:
             add_href_prefix(soup, "http://localhost:8000")
         return soup
 
+    def _fetch(self, *args, **kwargs):
+        """
+        Makes a get request following redirects and return the decoded
+        content of the final response.
+        """
+        response = self.get(*args, **kwargs)
+        while getattr(response, "url", None):
+            response = self.get(response.url)
+        return response.content.decode(response.charset)
+
 
 def add_href_prefix(soup, prefix):
-    for link in soup.find_all("a"):
-        if link["href"].starswith("/"):
+    for link in soup.find_all("a", href=True):
+        if link["href"].startswith("/"):
             link["href"] = prefix + link["href"]
@@ -5,10 +5,6 @@ from html.parser import HTMLParser
 
 from django.test.client import Client
 
-# Utility functions
-cte = lambda x: lambda *args: x
-choose = lambda cond, do, other: do if cond else other
-
 
 def crawl(url="/", skip_patterns=(), skip_urls=(), errors=(), user=None, log=print):
     """
@@ -40,20 +36,19 @@ def crawl(url="/", skip_patterns=(), skip_urls=(), errors=(), user=None, log=pri
     # Control urls that should be included/excluded from analysis
     skip_urls = set(skip_urls)
     skip_match = re.compile("|".join(skip_patterns)).match
-    errors_re = re.compile("|".join(errors))
-    keep = choose(
-        skip_patterns or skip_urls,
-        lambda x: (x not in skip_urls) and (not skip_match(x)),
-        cte(True),
+    is_skipped = (
+        (lambda link: link in skip_urls or skip_match(link))
+        if skip_patterns or skip_urls
+        else None
     )
-    is_error = choose(errors, lambda x: errors_re.match(x), cte(False))
-    log = log or cte(None)
+    is_error = re.compile("|".join(errors)).match if errors else None
 
     # Accumulation variables
     visited = {}
     pending = deque([url] if isinstance(url, str) else url)
     referrals = {}
     errors = {}
+    parser = HTMLAnchorFinder()
 
     while pending:
         url = pending.popleft()
@@ -62,16 +57,17 @@ def crawl(url="/", skip_patterns=(), skip_urls=(), errors=(), user=None, log=pri
 
         response = client.get(url)
         code = response.status_code
-        log(f"visited: {url} (code {code})")
+        if log:
+            log(f"visited: {url} (code {code})")
         visited[url] = code
 
         if code == 200:
             text = response.content.decode(response.charset)
-            links = find_urls(text, url)
-            links = list(filter(keep, links))
-            referrals.update((link, url) for link in links)
-            pending.extend(links)
-            errors.update((x, url) for x in links if is_error(x))
+            links = parser.find(text, url)
+            new = register_links(
+                links, url, visited, referrals, errors, is_skipped, is_error
+            )
+            pending.extend(new)
 
         elif code in (301, 302):
             pending.append(response.url)
@@ -81,18 +77,15 @@ def crawl(url="/", skip_patterns=(), skip_urls=(), errors=(), user=None, log=pri
     return errors, visited
 
 
-def check_link_errors(*args, visit=(), user="user", **kwargs):
+def check_link_errors(*args, **kwargs):
     """
     Craw site starting from the given base URL and raise an error if the
     resulting error dictionary is not empty.
 
     Notes:
-        Accept the same arguments of the :func:`crawl` function.
+        Accept the same arguments of the :func:`find_link_errors` function.
     """
-    errors, visited = crawl(*args, **kwargs)
-    for url in visit:
-        if url not in visited:
-            errors[url] = f"URL was not visited by {user}"
+    errors, visited = find_link_errors(*args, **kwargs)
     if errors:
         for url, code in errors.items():
             if isinstance(code, int):
@@ -103,9 +96,44 @@ def check_link_errors(*args, visit=(), user="user", **kwargs):
     return visited
 
 
+def find_link_errors(*args, visit=(), user="user", **kwargs):
+    """
+    Like :func:`check_link_errors`, but return a tuple of (errors, visited)
+    dictionaries instead of raising an error.
+
+    Notes:
+        Accept the same arguments of the :func:`crawl` function.
+    """
+    errors, visited = crawl(*args, **kwargs)
+    for url in visit:
+        if url not in visited:
+            errors[url] = f"URL was not visited by {user}"
+    return errors, visited
+
+
 #
 # Utility
 #
+def register_links(links, origin, visited, referrals, errors, is_skipped, is_error):
+    """
+    Register links found in the origin page and return the ones that were not
+    visited yet.
+
+    Skipped links are ignored and links matching is_error are saved in the
+    errors dictionary. Predicates can be None.
+    """
+    new = []
+    for link in links:
+        if is_skipped is not None and is_skipped(link):
+            continue
+        referrals[link] = origin
+        if is_error is not None and is_error(link):
+            errors[link] = origin
+        if link not in visited:
+            new.append(link)
+    return new
+
+
 class HTMLAnchorFinder(HTMLParser):
     SKIP_VALUE_RE = re.compile(r"http://|https://|#.*|^$")
 
@@ -131,6 +159,18 @@ class HTMLAnchorFinder(HTMLParser):
     def error(self, message):
         print(message, file=sys.stdout)
 
+    def find(self, src, current="/"):
+        """
+        Reset parser and return a new set with all urls found in src.
+
+        This allows reusing the same parser instance for several pages.
+        """
+        self.reset()
+        self.data = set()
+        self.current = current
+        self.feed(src)
+        return self.data
+
     def iter_urls(self):
         return iter(self.data)
 
@@ -141,6 +181,5 @@ def find_urls(src, base_path="/"):
 
     Normalizes to absolute paths by using the base_url as reference.
     """
-    parser = HTMLAnchorFinder(set(), base_path)
-    parser.feed(src)
-    return parser.iter_urls()
+    parser = HTMLAnchorFinder()
+    return iter(parser.find(src, base_path))
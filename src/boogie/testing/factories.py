@@ -77,7 +77,7 @@ def explicit_declaration(model, name, value):
         value:
             Value explicitly passed by the user
     """
-    if issubclass(value, BaseDeclaration):
+    if isinstance(value, BaseDeclaration):
         return value
     elif isinstance(value, type) and issubclass(value, Factory):
         return _factory.SubFactory(value)
@@ -135,8 +135,12 @@ def has_no_args(func):
     """
     Return True if function is called with no positional args.
     """
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        # Plain functions and bound methods do not require argspec parsing
+        return code.co_argcount == (1 if inspect.ismethod(func) else 0)
     try:
         spec = inspect.getfullargspec(func)
     except TypeError:
         return has_no_args(func.__call__)
-    return bool(spec.args)
+    return not spec.args
@@ -0,0 +1,28 @@
+"""
+Pytest plugin with optional speed ups for Django test suites.
+
+Enable it with ``pytest -p boogie.testing.plugin`` or by declaring
+``pytest_plugins = ["boogie.testing.plugin"]`` in your root conftest.py.
+"""
+import os
+
+
+def pytest_configure(config):
+    if os.environ.get("BOOGIE_FAST_DB"):
+        use_memory_database()
+
+
+def use_memory_database(alias="default"):
+    """
+    Replace the given database by an in-memory SQLite database.
+
+    Only ENGINE and NAME are changed, other keys such as TEST, OPTIONS and
+    ATOMIC_REQUESTS are preserved.
+    """
+    from django.conf import settings
+    from django.db import connections
+
+    db = settings.DATABASES.setdefault(alias, {})
+    db.update(ENGINE="django.db.backends.sqlite3", NAME=":memory:")
+    connections.ensure_defaults(alias)
+    connections.prepare_test_settings(alias)
@@ -1,20 +1,22 @@
-import copy
+from functools import lru_cache
 from itertools import chain
 
 import pytest
 from _pytest.fixtures import FixtureLookupError
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ValidationError, ImproperlyConfigured
 from django.http import Http404
-from django.urls import resolve
+from django.urls import resolve, get_urlconf
 
 from .client import Client
-from .crawler import check_link_errors
+from .crawler import find_link_errors
 from .urlchecker import LOGIN_REGEX, UrlChecker as _UrlChecker
 from ..utils.text import snake_case
 
 User = get_user_model()
+ANONYMOUS = AnonymousUser()
 
 
 #
@@ -40,8 +42,8 @@ class UserFixtures:
     """
 
     @pytest.fixture
-    def anonymous(self, db):
-        return AnonymousUser()
+    def anonymous(self):
+        return ANONYMOUS
 
     @pytest.fixture
     def user(self, db):
@@ -80,9 +82,9 @@ class UserFixtures:
         return self._with_login(client, admin)
 
     def _with_login(self, client, user):
-        # We create a copy because we don't want to share state between the
-        # different client fixtures.
-        client = copy.copy(client)
+        # We create a new client of the same class and defaults because we
+        # don't want to share state between the different client fixtures.
+        client = type(client)(**client.defaults)
         client.force_login(user)
         return client
 
@@ -101,10 +103,12 @@ class UserFixtures:
             is_staff, is_superuser (bool):
                 Tells if user can access the admin interface (staff) or is a
                 sysadmin (superuser).
+
+        Users that receive a password are hashed with the PASSWORD_HASHERS
+        setting. Consider using the fast MD5PasswordHasher in test settings.
         """
-        model = get_user_model()
         kwargs.update(is_superuser=is_superuser, is_staff=is_staff, email=email)
-        return model.objects.create_user(name, **kwargs)
+        return User.objects.create_user(name, **kwargs)
 
 
 #
@@ -205,22 +209,32 @@ class UrlTester(UserFixtures):
     post_paths: dict = {}
     login_regex: str = LOGIN_REGEX
     url_checker = _UrlChecker
+    url_workers: int = 1
+    url_fast: bool = False
+    _user_fixture_names = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        users = set(chain(cls.paths, cls.post_paths))
+        users.discard(None)
+        cls._user_fixture_names = tuple(sorted(users))
 
     @pytest.fixture
     def data(self):
         return None
 
-    @pytest.fixture
-    def client(self, db):
-        return Client()
-
     @pytest.mark.django_db
     def test_urls(self, request, client, data):
         """
         Implements the logic used by the dynamic test_urls class.
         """
         users = self.get_user_fixtures(request)
-        kwargs = {"login_regex": self.login_regex, "client": client}
+        kwargs = {
+            "login_regex": self.login_regex,
+            "client": client,
+            "workers": self.url_workers,
+            "fast": self.url_fast,
+        }
         checker = self.url_checker(self.paths, self.post_paths, **kwargs)
         errors = checker.check_url_errors(users=users)
         if errors:
@@ -234,9 +248,8 @@ class UrlTester(UserFixtures):
         Creates a dictionary mapping names of user fixtures to their respective
         values.
         """
-        users = set(chain(self.paths, self.post_paths))
-        users.discard(None)
-        return {user: request.getfixturevalue(user) for user in users}
+        names = self._user_fixture_names
+        return {user: request.getfixturevalue(user) for user in names}
 
 
 #
@@ -259,6 +272,23 @@ class CrawlerTester:
             Checks if all URLs in that list were visited after crawling ends.
         user (str):
             Name of user instance fixture.
+
+    The tester also loads an optional "data" fixture before crawling, which
+    can be used to populate the database. Crawling is slow and each crawler
+    test re-creates the data, so consider a class scoped fixture when many
+    tests share the same data:
+
+    .. code-block:: python
+
+        class TestUrls(CrawlerTester):
+            @pytest.fixture(scope="class")
+            def data(self, django_db_blocker):
+                with django_db_blocker.unblock():
+                    objects = [Model.objects.create(...)]
+                yield objects
+                with django_db_blocker.unblock():
+                    for obj in objects:
+                        obj.delete()
     """
 
     start = "/"
@@ -279,10 +309,14 @@ class CrawlerTester:
         """
         Test if it fails in some view when crawling from a starting URL.
         """
-        try:
-            request.getfixturevalue("data")
-        except FixtureLookupError:
-            pass
+        # Remember classes without a data fixture. We check the class
+        # __dict__ since sub-classes may define the fixture.
+        cls = type(self)
+        if cls.__dict__.get("_has_data_fixture", True):
+            try:
+                request.getfixturevalue("data")
+            except FixtureLookupError:
+                cls._has_data_fixture = False
 
         errors = {}
         user = conf["user"]
@@ -291,18 +325,16 @@ class CrawlerTester:
             start = [start]
 
         for url in start:
-            try:
-                check_link_errors(
-                    url,
-                    visit=self.must_visit,
-                    errors=self.xfail,
-                    user=user,
-                    skip_patterns=self.skip_patterns,
-                    skip_urls=self.skip_urls,
-                    log=self.log,
-                )
-            except AssertionError as ex:
-                errors.update(ex.args[0])
+            url_errors, _ = find_link_errors(
+                url,
+                visit=self.must_visit,
+                errors=self.xfail,
+                user=user,
+                skip_patterns=self.skip_patterns,
+                skip_urls=self.skip_urls,
+                log=self.log,
+            )
+            errors.update(url_errors)
         if errors:
             raise self.error_class(errors)
 
@@ -330,11 +362,19 @@ class ModelTester:
     representation: str
     absolute_url: str
     db = False
+    _has_absolute_url = False
+    _model_fixture_name = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        model = getattr(cls, "model", None)
+        if model is not None:
+            cls._has_absolute_url = hasattr(model, "get_absolute_url")
+            cls._model_fixture_name = snake_case(model.__name__)
 
     @pytest.fixture
     def instance(self, request):
-        model_name = snake_case(self.model.__name__)
-        name = getattr(self, "instance_fixture", model_name)
+        name = getattr(self, "instance_fixture", self._model_fixture_name)
         if self.db:
             request.getfixturevalue("db")
         try:
@@ -347,9 +387,8 @@ class ModelTester:
         Fallback method that is executed when the instance or model fixtures are
         not defined.
         """
-        model_name = snake_case(self.model.__name__)
         raise ImproperlyConfigured(
-            f'please either define an "instance" or "{model_name}"\n'
+            f'please either define an "instance" or "{self._model_fixture_name}"\n'
             f'fixture in your class or implement the "get_instance" method'
         )
 
@@ -367,7 +406,6 @@ class ModelTester:
         """
         Test if model implements a basic Django Model interface correctly.
         """
-        model = self.model
         self.check_improperly_configured(instance)
 
         # Check representation
@@ -378,11 +416,10 @@ class ModelTester:
             raise AssertionError(msg % (expect, got))
 
             # Check absolute url
-        if hasattr(model, "get_absolute_url"):
+        if self._has_absolute_url:
             assert instance.get_absolute_url() == self.absolute_url
-            try:
-                resolve(self.absolute_url)
-            except Http404:
+            urlconf = get_urlconf() or settings.ROOT_URLCONF
+            if not resolves(self.absolute_url, urlconf):
                 raise AssertionError("absolute_url resulted on a 404")
 
         # Run examples
@@ -399,8 +436,7 @@ class ModelTester:
         """
         Check if test class was correctly set up for instance.
         """
-        model = self.model
-        requires_url = hasattr(model, "get_absolute_url")
+        requires_url = self._has_absolute_url
 
         # Check success
         if hasattr(self, "representation") and (
@@ -408,18 +444,31 @@ class ModelTester:
         ):
             return
 
-        print(
+        raise ImproperlyConfigured(
+            "Model tester class is not configured\n\n"
             "HINT: You can create a valid tester class by replacing it by\n"
-            "the following code:"
+            "the following code:\n"
+            f"{make_test_class(self, instance)}\n\n"
+            "Please revise to see if inferred properties are correct."
         )
-        print(make_test_class(self, instance))
-        print("\nPlease revise to see if inferred properties are correct.")
-        raise ImproperlyConfigured("Model tester class is not configured")
 
 
 #
 # Utility
 #
+@lru_cache(maxsize=512)
+def resolves(url, urlconf):
+    """
+    Return True if url can be resolved in the given urlconf.
+
+    Results are cached since the same absolute urls are resolved by many
+    tests.
+    """
+    try:
+        resolve(url, urlconf)
+        return True
+    except Http404:
+        return False
 
 
 def make_test_class(model_tester, instance):
@@ -436,5 +485,5 @@ def make_test_class(model_tester, instance):
     if model_tester.db:
         base += "\n        db = True"
     if hasattr(instance, "get_absolute_url"):
-        base += "\n        absolute_url = {instance.get_absolute_url()!r}"
+        base += f"\n        absolute_url = {instance.get_absolute_url()!r}"
     return base
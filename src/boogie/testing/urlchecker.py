@@ -1,27 +1,102 @@
-from django.test import Client
-
-LOGIN_REGEX = r"^/login/*.$"
+import copy
+import re
+from concurrent.futures import ThreadPoolExecutor
+from http.cookies import SimpleCookie
+from importlib import import_module
+from itertools import chain
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.db import connections
+from django.http import Http404, HttpResponseForbidden, HttpResponseNotFound
+from django.test import Client, RequestFactory
+from django.urls import Resolver404, resolve
+
+LOGIN_PATTERN = re.compile(r"^/login/*.$")
+LOGIN_REGEX = LOGIN_PATTERN.pattern
+SUCCESS_CODES = frozenset({200, 301, 302})
+DENIED_CODES = frozenset({302, 404})
 
 
 class UrlChecker:
     """
     Checks the response code for specific urls in an app.
+
+    If workers > 1, requests are dispatched in parallel from a thread pool.
+    Each thread uses its own database connection and thus it only sees
+    committed data. It must be used with transactional_db or with data
+    created outside of test transactions and it refuses to run inside an
+    atomic block. Each thread also uses its own client, but Django's test client captures templates and exceptions
+    through global signals. Those may be attributed to a request running
+    in another thread, so parallel checks should only be trusted for
+    status codes.
+
+    If fast=True, public urls are checked by resolving the view and calling
+    it directly with a request built by a RequestFactory. This skips the
+    middleware chain and should only be used if the public views do not
+    depend on it other than for request.user and request.session.
     """
 
-    def __init__(self, urls, posts, login_regex=LOGIN_REGEX, client=None):
+    def __init__(
+        self,
+        urls,
+        posts,
+        login_regex=LOGIN_PATTERN,
+        client=None,
+        workers=1,
+        fast=False,
+    ):
         self.client = client or Client()
         self.urls = urls or {}
         self.posts = posts or {}
-        self.login_regex = login_regex
+        self.login_regex = re.compile(login_regex)
+        self.workers = workers
+        self.fast = fast
+        self._sessions = {}
+
+    #
+    # Login state
+    #
+    def login(self, user):
+        """
+        Log client in as the given user.
+
+        Session cookies are cached and restored in subsequent logins of the
+        same user, as long as the session still exists in the session store.
+        """
+        cookies = self._sessions.get(user.pk)
+        if cookies is not None and self._session_exists(cookies):
+            self.client.cookies = copy.copy(cookies)
+        else:
+            self.client.force_login(user)
+            self._sessions[user.pk] = copy.copy(self.client.cookies)
+
+    def logout(self):
+        """
+        Remove login cookies from client.
+
+        Unlike client.logout(), it keeps the session in the session store so
+        it can be restored by a later call to login().
+        """
+        self.client.cookies = SimpleCookie()
+
+    def _session_exists(self, cookies):
+        morsel = cookies.get(settings.SESSION_COOKIE_NAME)
+        if morsel is None:
+            return False
+        engine = import_module(settings.SESSION_ENGINE)
+        return engine.SessionStore().exists(morsel.value)
 
     #
     # Get errors from a URL list
     #
-    def get_error(self, url, code):
+    def get_error(self, url, code, client=None):
         """
         Check if client responds to given url with the provided status code.
         """
-        response = self.client.get(url)
+        response = (client or self.client).get(url)
         if response.status_code not in code:
             return url, response
 
@@ -33,87 +108,136 @@ class UrlChecker:
         if isinstance(url, str):
             return url, default
         elif isinstance(url, tuple):
-            url, codes = url
-            return url, codes
+            url, *codes = url
+            if len(codes) == 1 and not isinstance(codes[0], int):
+                codes = codes[0]
+            return url, frozenset(codes)
         else:
             raise TypeError(f"invalid url spec: {url} ({type(url).__name__})")
 
-    def collect_errors(self, urls, default_codes) -> dict:
+    def collect_errors(self, urls, default_codes, get=None) -> dict:
         """
         Return a mapping from url to their respective errors without changing
         the client login state.
         """
+        pairs = [self.get_url_codes(url, default_codes) for url in urls]
+        if get is None and self.workers > 1 and len(pairs) >= 4:
+            check_committed_data()
+            chunks = [pairs[i :: self.workers] for i in range(self.workers)]
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = executor.map(self._get_errors_in_thread, chunks)
+                return dict(chain.from_iterable(results))
+
         errors = {}
-        for url in urls:
-            url, codes = self.get_url_codes(url, default_codes)
-            error = self.get_error(url, codes)
-            if error is not None:
-                errors.update([error])
+        get = get or self.client.get
+        for url, codes in pairs:
+            response = get(url)
+            if response.status_code not in codes:
+                errors[url] = response
         return errors
 
+    def _get_errors_in_thread(self, pairs):
+        # Each worker has its own client and cookie jar, since concurrent
+        # requests may update the cookies.
+        client = Client()
+        client.cookies = copy.deepcopy(self.client.cookies)
+        try:
+            errors = (self.get_error(*pair, client=client) for pair in pairs)
+            return [error for error in errors if error is not None]
+        finally:
+            connections.close_all()
+
+    def get_direct(self, url):
+        """
+        Return the response of an anonymous request to url by calling the
+        view function directly, bypassing the client and middleware.
+        """
+        try:
+            match = resolve(urlsplit(url).path)
+        except Resolver404:
+            return HttpResponseNotFound()
+
+        request = RequestFactory().get(url)
+        request.user = AnonymousUser()
+        request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+        try:
+            response = match.func(request, *match.args, **match.kwargs)
+        except Http404:
+            return HttpResponseNotFound()
+        except PermissionDenied:
+            return HttpResponseForbidden()
+        if callable(getattr(response, "render", None)):
+            response = response.render()
+        return response
+
     def check_public_urls(self, urls) -> dict:
         """
         Return a mapping of url to their corresponding errors when an error
         occurs.
         """
-        self.client.logout()
-        return self.collect_errors(urls, (200, 301, 302))
+        self.logout()
+        get = self.get_direct if self.fast else None
+        return self.collect_errors(urls, SUCCESS_CODES, get=get)
 
     def check_user_access(self, urls, user) -> dict:
         """
         Return a mapping of url to their corresponding errors when an error
         occurs.
         """
-        self.client.force_login(user)
-        return self.collect_errors(urls, (200, 301, 302))
+        self.login(user)
+        return self.collect_errors(urls, SUCCESS_CODES)
 
     def check_login_required(self, urls) -> dict:
         """
         Return a mapping of url to their corresponding errors for failed login
         redirects.
         """
-        self.client.logout()
-        url_map = dict(urls)
-        url_map.pop(None, None)
-        urls = []
-        for url_list in url_map.values():
-            urls.extend(url_list)
-        return self.collect_errors(urls, (302, 404))
+        self.logout()
+        private = (lst for name, lst in urls.items() if name is not None)
+        return self.collect_errors(chain.from_iterable(private), DENIED_CODES)
 
     def check_restricted_pages(self, urls, user) -> dict:
         """
         Return a mapping of url to their corresponding errors for cases that
         grant unwanted access to resources.
         """
-        self.client.force_login(user)
-        return self.collect_errors(urls, (302, 404))
+        self.login(user)
+        return self.collect_errors(urls, DENIED_CODES)
 
     def check_url_errors(self, users: dict) -> dict:
         """
         Runs all checks and create a dictionary with all errors.
         """
-        urls = dict(self.urls)
+        public = self.urls.get(None, ())
+        private = [(name, lst) for name, lst in self.urls.items() if name is not None]
         errors = {}
 
         # Public urls
-        errors.update(self.check_public_urls(urls.pop(None, ())))
+        errors.update(self.check_public_urls(public))
 
         # Test each user
-        for name, url_list in urls.items():
-            user = users[name]
-            errors.update(self.check_user_access(url_list, user))
+        for name, url_list in private:
+            errors.update(self.check_user_access(url_list, users[name]))
 
         # Test login redirects
-        errors.update(self.check_login_required(urls))
+        errors.update(self.check_login_required(self.urls))
 
         # Test permissions
         if "user" in users:
-            user = users["user"]
-            url_list = []
-            for other_user, other_urls in urls.items():
-                if other_user not in (None, "user"):
-                    url_list.extend(other_urls)
-            if url_list:
-                errors.update(self.check_restricted_pages(url_list, user))
+            restricted = [url for name, lst in private if name != "user" for url in lst]
+            if restricted:
+                errors.update(self.check_restricted_pages(restricted, users["user"]))
 
         return errors
+
+
+def check_committed_data():
+    """
+    Raise ImproperlyConfigured if the current thread is inside an atomic
+    block, since its data would not be visible from other threads.
+    """
+    if any(conn.in_atomic_block for conn in connections.all()):
+        raise ImproperlyConfigured(
+            "parallel url checks require committed data. Use the "
+            "transactional_db fixture instead of db."
+        )
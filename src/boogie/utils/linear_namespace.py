@@ -1,11 +1,7 @@
-import re
+from functools import lru_cache
+from operator import itemgetter
 
-RE_NAME = re.compile(r"^\w+$")
 FULL_SLICE = slice(None, None, None)
-INIT_TEMPLATE = """
-def __init__(self, {fields}):
-    self._data = [{fields}]
-"""
 
 
 def linear_namespace(name, fields):
@@ -21,7 +17,7 @@ def linear_namespace(name, fields):
 
     fields = tuple(fields)
     prop = make_item_accessor
-    class_dict = dict(__init__=make_init(fields), _fields=fields)
+    class_dict = dict(__init__=make_init(fields), _fields=fields, __slots__=())
     class_dict.update((name, prop(i)) for i, name in enumerate(fields))
     return type(name, (LinearNamespaceBase,), class_dict)
 
@@ -30,7 +26,8 @@ def linear_namespace_from_sequence(cls, data, copy=True):
     """
     Create a new linear space from a sequence
 
-    If a list is given, and copy=False, it will be reused as data.
+    Data is always copied. The copy argument is kept only for backwards
+    compatibility.
 
     >>> Point = linear_namespace('Point', ['x', 'y'])
     >>> linear_namespace_from_sequence(Point, [1, 2])
@@ -41,8 +38,8 @@ def linear_namespace_from_sequence(cls, data, copy=True):
         n = len(cls._fields)
         raise ValueError("expected a sequence with %s paramenters" % n)
 
-    new = object.__new__(cls)
-    new._data = list(data) if copy or type(data) is not list else data
+    new = list.__new__(cls)
+    list.extend(new, data)
     return new
 
 
@@ -57,35 +54,58 @@ def make_init(args):
     if len(set(args)) != len(args):
         raise ValueError("arguments cannot be repeated")
 
-    names = ", ".join(args)
-    ns = {}
-    exec(INIT_TEMPLATE.format(fields=names), ns)
-    return ns["__init__"]
+    fields = tuple(args)
+    size = len(fields)
 
+    def __init__(self, *args, **kwargs):
+        if kwargs or len(args) != size:
+            args = bind_args(fields, args, kwargs)
+        list.__init__(self, args)
 
+    return __init__
+
+
+@lru_cache(maxsize=None)
 def make_item_accessor(idx):
     """
     Returns a property that mirrors access to the idx-th value of an object.
+
+    Properties are shared by all linear namespaces with a field in the same
+    position.
     """
 
-    @property
-    def attr(self):
-        return self[idx]
+    def setter(self, value):
+        list.__setitem__(self, idx, value)
 
-    @attr.setter
-    def attr(self, value):
-        self[idx] = value
+    return property(itemgetter(idx), setter)
 
-    return attr
 
+def tuple_coercing(method):
+    """
+    Wraps a list comparison method so it also accepts tuples.
 
-class LinearNamespaceBase:
+    Other operands are passed untouched to the C implementation.
+    """
+
+    def comparison(self, other):
+        if type(other) is tuple:
+            other = list(other)
+        return method(self, other)
+
+    comparison.__name__ = method.__name__
+    return comparison
+
+
+class LinearNamespaceBase(list):
     """
     Linear namespace are used as the base class for Row() instances
     in Boogie query sets.
+
+    Linear namespaces are lists with a fixed size. Methods that would change
+    the size of the list are disabled.
     """
 
-    __slots__ = ("_data",)
+    __slots__ = ()
 
     fromseq = classmethod(linear_namespace_from_sequence)
 
@@ -93,38 +113,40 @@ class LinearNamespaceBase:
         if i == FULL_SLICE and len(value) != len(self):
             raise ValueError("cannot")
         else:
-            self._data[i] = value
-
-    def __getitem__(self, i):
-        return self._data.__getitem__(i)
+            list.__setitem__(self, i, value)
 
     def __repr__(self):
         args = ", ".join(repr(x) for x in self)
         return "%s(%s)" % (type(self).__name__, args)
 
-    # Sequence
-    __iter__ = lambda self: self._data.__iter__()
-    __len__ = lambda self: self._data.__len__()
+    def __reduce__(self):
+        # The default list protocol rebuilds instances with append/extend
+        return linear_namespace_from_sequence, (type(self), list(self))
+
+    def _fixed_size(self, *args, **kwargs):
+        raise TypeError("cannot change the size of a linear namespace")
+
+    # In-place operators fall back to __add__ and __mul__ and return new lists
+    __iadd__ = __imul__ = lambda self, x: NotImplemented
+
+    # List methods that change the instance size
+    append = extend = insert = pop = remove = clear = _fixed_size
+    __delitem__ = _fixed_size
 
     # Arithmetic
-    __add__ = lambda self, x: self._data.__add__(as_data(self, x))
-    __radd__ = lambda self, x: as_data(self, x).__add__(self._data)
-    __mul__ = lambda self, x: self._data.__mul__(as_data(self, x))
-    __rmul__ = lambda self, x: self._data.__rmul__(as_data(self, x))
+    def __add__(self, other):
+        return list.__add__(self, as_data(self, other))
 
-    # Logical operators
-    __eq__ = lambda self, x: self._data.__eq__(as_data(self, x))
-    __ne__ = lambda self, x: self._data.__ne__(as_data(self, x))
-    __lt__ = lambda self, x: self._data.__lt__(as_data(self, x))
-    __le__ = lambda self, x: self._data.__le__(as_data(self, x))
-    __gt__ = lambda self, x: self._data.__gt__(as_data(self, x))
-    __ge__ = lambda self, x: self._data.__ge__(as_data(self, x))
+    def __radd__(self, other):
+        return as_data(self, other) + list(self)
 
-    # Public list methods that do not change the instance size
-    count = lambda self, value: self._data.count(value)
-    index = lambda self, value, *args: self._data.index(value, *args)
-    sort = lambda self, **kwargs: self._data.sort(**kwargs)
-    reverse = lambda self: self._data.reverse()
+    # Logical operators
+    __eq__ = tuple_coercing(list.__eq__)
+    __ne__ = tuple_coercing(list.__ne__)
+    __lt__ = tuple_coercing(list.__lt__)
+    __le__ = tuple_coercing(list.__le__)
+    __gt__ = tuple_coercing(list.__gt__)
+    __ge__ = tuple_coercing(list.__ge__)
 
 
 LINEAR_NAMESPACE_API = {"_fields", "fromseq", "index", "count", "sort", "reverse"}
@@ -139,12 +161,13 @@ def linear_namespace_cached(name, attrs):
     of name, attrs.
     """
 
-    attrs = tuple(attrs)
+    key = (name, tuple(attrs))
     try:
-        return LINEAR_NAMESPACE_CACHE[name, attrs]
+        return LINEAR_NAMESPACE_CACHE[key]
     except KeyError:
-        new_type = linear_namespace(name, attrs)
-        return LINEAR_NAMESPACE_CACHE.setdefault((name, attrs), new_type)
+        # setdefault is atomic, so racing threads agree on a single type
+        new_type = linear_namespace(*key)
+        return LINEAR_NAMESPACE_CACHE.setdefault(key, new_type)
 
 
 linear_namespace.fromseq = linear_namespace_from_sequence
@@ -154,21 +177,47 @@ linear_namespace.fromseq = linear_namespace_from_sequence
 # Utility functions
 #
 def is_valid_python_name(name):
-    if not name or name[0].isdigit() or name.startswith("__"):
-        return False
-    if name in LINEAR_NAMESPACE_API:
-        return False
-    return RE_NAME.match(name) is not None
+    return (
+        name.isidentifier()
+        and not name.startswith("__")
+        and name not in LINEAR_NAMESPACE_API
+    )
+
+
+def bind_args(fields, args, kwargs):
+    """
+    Return a list of values for the given fields from positional and keyword
+    arguments.
+    """
+    if len(args) > len(fields):
+        msg = "expected at most %s arguments, got %s"
+        raise TypeError(msg % (len(fields), len(args)))
+
+    values = list(args)
+    kwargs = dict(kwargs)
+    for name in fields[len(args) :]:
+        try:
+            values.append(kwargs.pop(name))
+        except KeyError:
+            raise TypeError("missing argument: %r" % name)
+    if kwargs:
+        raise TypeError("invalid arguments: %s" % ", ".join(kwargs))
+    return values
 
 
 def as_data(self, other):
     """
     Convert other to a compatible data type.
     """
-    if isinstance(other, list):
+    # Exact type checks handle the common cases before isinstance() walks
+    # the MRO.
+    cls = type(other)
+    if cls is list or cls is type(self):
+        return other
+    elif cls is tuple:
+        return list(other)
+    elif isinstance(other, list):
         return other
-    elif isinstance(other, type(self)):
-        return other._data
     elif isinstance(other, tuple):
         return list(other)
     return other
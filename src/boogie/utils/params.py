@@ -4,6 +4,10 @@ from collections.abc import MutableMapping
 CONF_PARAMS = defaultdict(dict)
 GLOBAL_PARAMS = defaultdict(dict)
 
+# Incremented every time CONF_PARAMS or GLOBAL_PARAMS are updated. Params
+# instances use it to invalidate their merged view of all stores.
+PARAMS_VERSION = 0
+
 
 class Params(MutableMapping):
     """
@@ -24,41 +28,52 @@ class Params(MutableMapping):
         self._global = GLOBAL_PARAMS[id]
         self._defaults = dict(defaults)
         self._stores = [self._local, self._conf, self._global, self._defaults]
+        self._merged = None
+        self._version = None
 
     def __repr__(self):
         return repr(dict(self))
 
     def __call__(self, **kwargs):
         new_local = dict(self._local, **kwargs)
-        return Params(id, new_local, self._defaults)
+        return Params(self._id, new_local, self._defaults)
 
     def __getitem__(self, key):
-        for store in self._stores:
-            if key in store:
-                return store[key]
-        raise KeyError(key)
+        return self._get_merged()[key]
 
     def __setitem__(self, key, value):
         self._local[key] = value
+        if self._version == PARAMS_VERSION:
+            self._merged[key] = value
 
     def __delitem__(self, key):
         if key in self._local:
             del self._local[key]
         elif key in self._defaults:
             del self._defaults[key]
-        raise KeyError(key)
+        else:
+            raise KeyError(key)
+        self._version = None
 
     def __len__(self):
-        return sum(1 for _ in self)
+        return len(self._get_merged())
 
     def __iter__(self):
-        used = set()
-        for store in self._stores:
-            for key in store:
-                if key not in used:
-                    yield key
-                else:
-                    used.add(key)
+        return iter(self._get_merged())
+
+    def _get_merged(self):
+        """
+        Return a dictionary merging all stores.
+
+        The dictionary is rebuilt only if some global or configuration
+        parameter was updated since the last call.
+        """
+        if self._version != PARAMS_VERSION:
+            self._merged = {}
+            for store in reversed(self._stores):
+                self._merged.update(store)
+            self._version = PARAMS_VERSION
+        return self._merged
 
 
 def get_params(id, **kwargs):
@@ -73,7 +88,10 @@ def set_params(id, **kwargs):
     """
     Declares a mapping of parameters and sets the global values for its keys.
     """
+    global PARAMS_VERSION
+
     GLOBAL_PARAMS[id].update(kwargs)
+    PARAMS_VERSION += 1
     return Params(id)
 
 
@@ -84,8 +102,10 @@ def update_configuration(dic):
 
     Return the update CONF_PARAMS dictionary.
     """
+    global PARAMS_VERSION
 
     for id, params in dic.items():
         CONF_PARAMS[id].update(params)
+    PARAMS_VERSION += 1
 
     return CONF_PARAMS
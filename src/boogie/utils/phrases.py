@@ -13,12 +13,9 @@ random phrase. If you want to learn more, read the source :)
 """
 
 import random
+from functools import lru_cache
 
-from faker import Factory
-
-fake = Factory.create("en-us")
-
-star_wars_characters = [
+star_wars_characters = (
     "Han Solo",
     "Darth Vader",
     "C3PO",
@@ -29,8 +26,8 @@ star_wars_characters = [
     "Obi Wan",
     "Yoda",
     "Jar Jar Binks",
-]
-famous_scientists = [
+)
+famous_scientists = (
     # Physicists
     "Einstein",
     "Newton",
@@ -57,8 +54,8 @@ famous_scientists = [
     "Lamarck",
     "Mayr",
     "Dobzhansky",
-]
-adjective_list = [
+)
+adjective_list = (
     "grumpy",
     "heroic",
     "coward",
@@ -66,9 +63,16 @@ adjective_list = [
     "treacherous",
     "powerful",
     "influential",
-]
+)
+_ADJ_TITLE = tuple(a.title() for a in adjective_list)
 phrase_groups = []
 
+# Pre-computed (adjective, subjective) pairs for the static phrase groups.
+# Sampling a single pair is cheaper than sampling each word independently.
+_STAR_WARS_COMBOS = [(a, s) for a in _ADJ_TITLE for s in star_wars_characters]
+_SCIENTIST_COMBOS = [(a, s) for a in _ADJ_TITLE for s in famous_scientists]
+_choice = random.choice
+
 
 def is_phase_provider(func):
     phrase_groups.append(func)
@@ -78,17 +82,18 @@ def is_phase_provider(func):
 def phrase(maker=None):
     """
     A random easy to memorize phrase.
+
+    If maker is given, it is used instead of a randomly chosen phrase
+    provider.
     """
-    maker = random.choice(phrase_groups)
-    return maker()
+    return (maker or _choice(phrase_groups))()
 
 
 def phrase_lower(maker=None):
     """
     Like phrase, but normalize to lowercase results.
     """
-    maker = random.choice(phrase_groups)
-    return maker().lower()
+    return phrase(maker).lower()
 
 
 def subjective_adjective_phrase(subjectives=None, adjectives=None):
@@ -96,9 +101,12 @@ def subjective_adjective_phrase(subjectives=None, adjectives=None):
     Return a new subjective-adjective phrase such as "Grumpy Einstein" from a
     list of subjectives and adjectives.
     """
-    subjective = random.choice(subjectives or famous_scientists)
-    adjective = random.choice(adjectives or adjective_list)
-    return "%s %s" % (adjective.title(), subjective)
+    subjective = _choice(subjectives or famous_scientists)
+    if adjectives:
+        adjective = _choice(adjectives).title()
+    else:
+        adjective = _choice(_ADJ_TITLE)
+    return "%s %s" % (adjective, subjective)
 
 
 @is_phase_provider
@@ -106,7 +114,7 @@ def random_star_wars_phrase():
     """
     Random phrase based on Star Wars ;-)
     """
-    return subjective_adjective_phrase(star_wars_characters)
+    return "%s %s" % _choice(_STAR_WARS_COMBOS)
 
 
 @is_phase_provider
@@ -114,7 +122,7 @@ def random_scientist_phrase():
     """
     Random phrase using important scientists.
     """
-    return subjective_adjective_phrase(famous_scientists)
+    return "%s %s" % _choice(_SCIENTIST_COMBOS)
 
 
 @is_phase_provider
@@ -122,7 +130,7 @@ def random_fake_phrase():
     """
     Use fake-factory names.
     """
-    return subjective_adjective_phrase([fake.first_name()])
+    return subjective_adjective_phrase([get_fake().first_name()])
 
 
 @is_phase_provider
@@ -130,4 +138,17 @@ def random_fake_catch():
     """
     Catch phrases
     """
-    return fake.catch_phrase()
+    return get_fake().catch_phrase()
+
+
+@lru_cache(1)
+def get_fake():
+    """
+    Return the shared faker instance, created on first use.
+
+    Faker loads its locale data on creation, hence we defer it until the
+    fake phrase providers are actually called.
+    """
+    from faker import Factory
+
+    return Factory.create("en-us")
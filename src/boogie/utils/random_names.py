@@ -1,831 +1,462 @@
-from random import choice
+from collections.abc import Mapping
+from functools import lru_cache
+from random import choices, random
+from string import Formatter
 
 from django.conf import settings
+from django.utils.translation import get_language, gettext, gettext_noop as N_
 from django.utils.translation import ugettext_lazy as _
 
-NAME_FORMAT = getattr(settings, "RANDOM_NAME_FORMAT", _("{adjective} {noun}"))
+DEFAULT_NAME_FORMAT = "{adjective} {noun}"
+NAME_FORMAT = getattr(settings, "RANDOM_NAME_FORMAT", _(DEFAULT_NAME_FORMAT))
 
 
 def random_name(fmt=NAME_FORMAT):
     """
     Name of the form <adjective> <noun>
     """
-    return fmt.format(adjective=choice(ADJECTIVES), noun=choice(NOUNS)).title()
+    adjectives, nouns = titled_words(get_language())
+
+    # Draw both indices from a single uniform variate. It avoids the overhead
+    # of random.choice() and has negligible bias for such small sequences.
+    i, j = divmod(int(random() * N_COMBINATIONS), N_NOUNS)
+    # Translations may change the template, so we use the translated value
+    return name_formatter(str(fmt))(adjectives[i], nouns[j])
+
+
+def random_names(n, fmt=NAME_FORMAT):
+    """
+    Return a list with n random names.
+
+    Words are drawn in batch, which is faster than calling
+    :func:`random_name` n times.
+    """
+    adjectives, nouns = titled_words(get_language())
+    render = name_formatter(str(fmt))
+    return list(map(render, choices(adjectives, k=n), choices(nouns, k=n)))
+
+
+def get_noun_description(noun):
+    """
+    Return the translated description for the given noun.
+    """
+    from .random_names_data import NOUN_DESCRIPTIONS
+
+    return gettext(NOUN_DESCRIPTIONS[noun])
+
+
+@lru_cache()
+def name_formatter(fmt):
+    """
+    Return a function that renders the name template fmt from a pair of
+    title-cased (adjective, noun) strings.
+
+    Templates are parsed only once and converted to a printf-style format,
+    which is faster than calling str.format() for each name.
+    """
+    if fmt == DEFAULT_NAME_FORMAT:
+        return lambda adjective, noun: f"{adjective} {noun}"
+
+    template = []
+    fields = []
+    for literal, field, spec, conversion in Formatter().parse(fmt):
+        template.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if spec or conversion or field not in ("adjective", "noun"):
+            return lambda adjective, noun: (
+                fmt.format(adjective=adjective, noun=noun).title()
+            )
+        template.append("%s")
+        fields.append(field)
+
+    template = "".join(template)
+    if fields == ["adjective", "noun"]:
+        return lambda adjective, noun: (template % (adjective, noun)).title()
+
+    def render(adjective, noun):
+        words = {"adjective": adjective, "noun": noun}
+        return (template % tuple(words[field] for field in fields)).title()
+
+    return render
+
+
+@lru_cache()
+def titled_words(language):
+    """
+    Return a tuple of (adjectives, nouns) translated to the given language
+    and converted to title case.
+    """
+    adjectives = tuple(gettext(word).title() for word in ADJECTIVES)
+    nouns = tuple(gettext(word).title() for word in NOUNS)
+    return adjectives, nouns
 
 
 #
 # Constants
 # (Adapted from https://github.com/moby/moby/blob/master/pkg/namesgenerator/names-generator.go)
 #
-ADJECTIVES = [
-    _("admiring"),
-    _("adoring"),
-    _("affectionate"),
-    _("agitated"),
-    _("amazing"),
-    _("angry"),
-    _("awesome"),
-    _("blissful"),
-    _("bold"),
-    _("boring"),
-    _("brave"),
-    _("charming"),
-    _("clever"),
-    _("cocky"),
-    _("cool"),
-    _("compassionate"),
-    _("competent"),
-    _("condescending"),
-    _("confident"),
-    _("cranky"),
-    _("crazy"),
-    _("dazzling"),
-    _("determined"),
-    _("distracted"),
-    _("dreamy"),
-    _("eager"),
-    _("ecstatic"),
-    _("elastic"),
-    _("elated"),
-    _("elegant"),
-    _("eloquent"),
-    _("epic"),
-    _("fervent"),
-    _("festive"),
-    _("flamboyant"),
-    _("focused"),
-    _("friendly"),
-    _("frosty"),
-    _("gallant"),
-    _("gifted"),
-    _("goofy"),
-    _("gracious"),
-    _("happy"),
-    _("hardcore"),
-    _("heuristic"),
-    _("hopeful"),
-    _("hungry"),
-    _("infallible"),
-    _("inspiring"),
-    _("jolly"),
-    _("jovial"),
-    _("keen"),
-    _("kind"),
-    _("laughing"),
-    _("loving"),
-    _("lucid"),
-    _("magical"),
-    _("mystifying"),
-    _("modest"),
-    _("musing"),
-    _("naughty"),
-    _("nervous"),
-    _("nifty"),
-    _("nostalgic"),
-    _("objective"),
-    _("optimistic"),
-    _("peaceful"),
-    _("pedantic"),
-    _("pensive"),
-    _("practical"),
-    _("priceless"),
-    _("quirky"),
-    _("quizzical"),
-    _("recursing"),
-    _("relaxed"),
-    _("reverent"),
-    _("romantic"),
-    _("sad"),
-    _("serene"),
-    _("sharp"),
-    _("silly"),
-    _("sleepy"),
-    _("stoic"),
-    _("stupefied"),
-    _("suspicious"),
-    _("sweet"),
-    _("tender"),
-    _("thirsty"),
-    _("trusting"),
-    _("unruffled"),
-    _("upbeat"),
-    _("vibrant"),
-    _("vigilant"),
-    _("vigorous"),
-    _("wizardly"),
-    _("wonderful"),
-    _("xenodochial"),
-    _("youthful"),
-    _("zealous"),
-    _("zen"),
-]
+ADJECTIVES = (
+    N_("admiring"),
+    N_("adoring"),
+    N_("affectionate"),
+    N_("agitated"),
+    N_("amazing"),
+    N_("angry"),
+    N_("awesome"),
+    N_("blissful"),
+    N_("bold"),
+    N_("boring"),
+    N_("brave"),
+    N_("charming"),
+    N_("clever"),
+    N_("cocky"),
+    N_("cool"),
+    N_("compassionate"),
+    N_("competent"),
+    N_("condescending"),
+    N_("confident"),
+    N_("cranky"),
+    N_("crazy"),
+    N_("dazzling"),
+    N_("determined"),
+    N_("distracted"),
+    N_("dreamy"),
+    N_("eager"),
+    N_("ecstatic"),
+    N_("elastic"),
+    N_("elated"),
+    N_("elegant"),
+    N_("eloquent"),
+    N_("epic"),
+    N_("fervent"),
+    N_("festive"),
+    N_("flamboyant"),
+    N_("focused"),
+    N_("friendly"),
+    N_("frosty"),
+    N_("gallant"),
+    N_("gifted"),
+    N_("goofy"),
+    N_("gracious"),
+    N_("happy"),
+    N_("hardcore"),
+    N_("heuristic"),
+    N_("hopeful"),
+    N_("hungry"),
+    N_("infallible"),
+    N_("inspiring"),
+    N_("jolly"),
+    N_("jovial"),
+    N_("keen"),
+    N_("kind"),
+    N_("laughing"),
+    N_("loving"),
+    N_("lucid"),
+    N_("magical"),
+    N_("mystifying"),
+    N_("modest"),
+    N_("musing"),
+    N_("naughty"),
+    N_("nervous"),
+    N_("nifty"),
+    N_("nostalgic"),
+    N_("objective"),
+    N_("optimistic"),
+    N_("peaceful"),
+    N_("pedantic"),
+    N_("pensive"),
+    N_("practical"),
+    N_("priceless"),
+    N_("quirky"),
+    N_("quizzical"),
+    N_("recursing"),
+    N_("relaxed"),
+    N_("reverent"),
+    N_("romantic"),
+    N_("sad"),
+    N_("serene"),
+    N_("sharp"),
+    N_("silly"),
+    N_("sleepy"),
+    N_("stoic"),
+    N_("stupefied"),
+    N_("suspicious"),
+    N_("sweet"),
+    N_("tender"),
+    N_("thirsty"),
+    N_("trusting"),
+    N_("unruffled"),
+    N_("upbeat"),
+    N_("vibrant"),
+    N_("vigilant"),
+    N_("vigorous"),
+    N_("wizardly"),
+    N_("wonderful"),
+    N_("xenodochial"),
+    N_("youthful"),
+    N_("zealous"),
+    N_("zen"),
+)
 
 # Please, for any amazing man that you add to the list, consider adding an
-# equally amazing woman to it, and vice versa.
-NOUN_DESCRIPTIONS = {
-    _("albattani"): _(
-        "Muhammad ibn Jābir al-Ḥarrānī al-Battānī was a founding father of astronomy. https://en.wikipedia.org/wiki/Mu%E1%B8%A5ammad_ibn_J%C4%81bir_al-%E1%B8%A4arr%C4%81n%C4%AB_al-Batt%C4%81n%C4%AB"
-    ),
-    _("allen"): _(
-        "Frances E. Allen, became the first female IBM Fellow in 1989. In 2006, she became the first female recipient of the ACM's Turing Award. https://en.wikipedia.org/wiki/Frances_E._Allen"
-    ),
-    _("almeida"): _(
-        "June Almeida - Scottish virologist who took the first pictures of the rubella virus - https://en.wikipedia.org/wiki/June_Almeida"
-    ),
-    _("antonelli"): _(
-        "Kathleen Antonelli, American computer programmer and one of the six original programmers of the ENIAC - https://en.wikipedia.org/wiki/Kathleen_Antonelli"
-    ),
-    _("agnesi"): _(
-        "Maria Gaetana Agnesi - Italian mathematician, philosopher, theologian and humanitarian. She was the first woman to write a mathematics handbook and the first woman appointed as a Mathematics Professor at a University. https://en.wikipedia.org/wiki/Maria_Gaetana_Agnesi"
-    ),
-    _("archimedes"): _(
-        "Archimedes was a physicist, engineer and mathematician who invented too many things to list them here. https://en.wikipedia.org/wiki/Archimedes"
-    ),
-    _("ardinghelli"): _(
-        "Maria Ardinghelli - Italian translator, mathematician and physicist - https://en.wikipedia.org/wiki/Maria_Ardinghelli"
-    ),
-    _("aryabhata"): _(
-        "Aryabhata - Ancient Indian mathematician-astronomer during 476-550 CE https://en.wikipedia.org/wiki/Aryabhata"
-    ),
-    _("austin"): _(
-        "Wanda Austin - Wanda Austin is the President and CEO of The Aerospace Corporation, a leading architect for the US security space programs. https://en.wikipedia.org/wiki/Wanda_Austin"
-    ),
-    _("babbage"): _(
-        "Charles Babbage invented the concept of a programmable computer. https://en.wikipedia.org/wiki/Charles_Babbage."
-    ),
-    _("banach"): _(
-        "Stefan Banach - Polish mathematician, was one of the founders of modern functional analysis. https://en.wikipedia.org/wiki/Stefan_Banach"
-    ),
-    _("banzai"): _(
-        "Buckaroo Banzai and his mentor Dr. Hikita perfectd the 'oscillation overthruster', a device that allows one to pass through solid matter. - https://en.wikipedia.org/wiki/The_Adventures_of_Buckaroo_Banzai_Across_the_8th_Dimension"
-    ),
-    _("bardeen"): _(
-        "John Bardeen co-invented the transistor - https://en.wikipedia.org/wiki/John_Bardeen"
-    ),
-    _("bartik"): _(
-        "Jean Bartik, born Betty Jean Jennings, was one of the original programmers for the ENIAC computer. https://en.wikipedia.org/wiki/Jean_Bartik"
-    ),
-    _("bassi"): _(
-        "Laura Bassi, the world's first female professor https://en.wikipedia.org/wiki/Laura_Bassi"
-    ),
-    _("beaver"): _(
-        "Hugh Beaver, British engineer, founder of the Guinness Book of World Records https://en.wikipedia.org/wiki/Hugh_Beaver"
-    ),
-    _("bell"): _(
-        "Alexander Graham Bell - an eminent Scottish-born scientist, inventor, engineer and innovator who is credited with inventing the first practical telephone - https://en.wikipedia.org/wiki/Alexander_Graham_Bell"
-    ),
-    _("benz"): _(
-        "Karl Friedrich Benz - a German automobile engineer. Inventor of the first practical motorcar. https://en.wikipedia.org/wiki/Karl_Benz"
-    ),
-    _("bhabha"): _(
-        "Homi J Bhabha - was an Indian nuclear physicist, founding director, and professor of physics at the Tata Institute of Fundamental Research. Colloquially known as 'father of Indian nuclear programme'- https://en.wikipedia.org/wiki/Homi_J._Bhabha"
-    ),
-    _("bhaskara"): _(
-        "Bhaskara II - Ancient Indian mathematician-astronomer whose work on calculus predates Newton and Leibniz by over half a millennium - https://en.wikipedia.org/wiki/Bh%C4%81skara_II#Calculus"
-    ),
-    _("black"): _(
-        "Sue Black - British computer scientist and campaigner. She has been instrumental in saving Bletchley Park, the site of World War II codebreaking - https://en.wikipedia.org/wiki/Sue_Black_(computer_scientist)"
-    ),
-    _("blackburn"): _(
-        "Elizabeth Helen Blackburn - Australian-American Nobel laureate; best known for co-discovering telomerase. https://en.wikipedia.org/wiki/Elizabeth_Blackburn"
-    ),
-    _("blackwell"): _(
-        "Elizabeth Blackwell - American doctor and first American woman to receive a medical degree - https://en.wikipedia.org/wiki/Elizabeth_Blackwell"
-    ),
-    _("bohr"): _(
-        "Niels Bohr is the father of quantum theory. https://en.wikipedia.org/wiki/Niels_Bohr."
-    ),
-    _("booth"): _(
-        "Kathleen Booth, she's credited with writing the first assembly language. https://en.wikipedia.org/wiki/Kathleen_Booth"
-    ),
-    _("borg"): _(
-        "Anita Borg - Anita Borg was the founding director of the Institute for Women and Technology (IWT). https://en.wikipedia.org/wiki/Anita_Borg"
-    ),
-    _("bose"): _(
-        "Satyendra Nath Bose - He provided the foundation for Bose–Einstein statistics and the theory of the Bose–Einstein condensate. - https://en.wikipedia.org/wiki/Satyendra_Nath_Bose"
-    ),
-    _("boyd"): _(
-        "Evelyn Boyd Granville - She was one of the first African-American woman to receive a Ph.D. in mathematics; she earned it in 1949 from Yale University. https://en.wikipedia.org/wiki/Evelyn_Boyd_Granville"
-    ),
-    _("brahmagupta"): _(
-        "Brahmagupta - Ancient Indian mathematician during 598-670 CE who gave rules to compute with zero - https://en.wikipedia.org/wiki/Brahmagupta#Zero"
-    ),
-    _("brattain"): _(
-        "Walter Houser Brattain co-invented the transistor - https://en.wikipedia.org/wiki/Walter_Houser_Brattain"
-    ),
-    _("brown"): _(
-        "Emmett Brown invented time travel. https://en.wikipedia.org/wiki/Emmett_Brown (thanks Brian Goff)"
-    ),
-    _("buck"): _(
-        "Linda Brown Buck - American biologist and Nobel laureate best known for her genetic and molecular analyses of the mechanisms of smell. https://en.wikipedia.org/wiki/Linda_B._Buck"
-    ),
-    _("burnell"): _(
-        "Dame Susan Jocelyn Bell Burnell - Northern Irish astrophysicist who discovered radio pulsars and was the first to analyse them. https://en.wikipedia.org/wiki/Jocelyn_Bell_Burnell"
-    ),
-    _("cannon"): _(
-        "Annie Jump Cannon - pioneering female astronomer who classified hundreds of thousands of stars and created the system we use to understand stars today. https://en.wikipedia.org/wiki/Annie_Jump_Cannon"
-    ),
-    _("carson"): _(
-        "Rachel Carson - American marine biologist and conservationist, her book Silent Spring and other writings are credited with advancing the global environmental movement. https://en.wikipedia.org/wiki/Rachel_Carson"
-    ),
-    _("cartwright"): _(
-        "Dame Mary Lucy Cartwright - British mathematician who was one of the first to study what is now known as chaos theory. Also known for Cartwright's theorem which finds applications in signal processing. https://en.wikipedia.org/wiki/Mary_Cartwright"
-    ),
-    _("cerf"): _(
-        "Vinton Gray Cerf - American Internet pioneer, recognised as one of 'the fathers of the Internet'. With Robert Elliot Kahn, he designed TCP and IP, the primary data communication protocols of the Internet and other computer networks. https://en.wikipedia.org/wiki/Vint_Cerf"
-    ),
-    _("chandrasekhar"): _(
-        "Subrahmanyan Chandrasekhar - Astrophysicist known for his mathematical theory on different stages and evolution in structures of the stars. He has won nobel prize for physics - https://en.wikipedia.org/wiki/Subrahmanyan_Chandrasekhar"
-    ),
-    _("chaplygin"): _(
-        "Sergey Alexeyevich Chaplygin (Russian: Серге́й Алексе́евич Чаплы́гин; April 5, 1869 – October 8, 1942) was a Russian and Soviet physicist, mathematician, and mechanical engineer. He is known for mathematical formulas such as Chaplygin's equation and for a hypothetical substance in cosmology called Chaplygin gas, named after him. https://en.wikipedia.org/wiki/Sergey_Chaplygin"
-    ),
-    _("chatelet"): _(
-        "Émilie du Châtelet - French natural philosopher, mathematician, physicist, and author during the early 1730s, known for her translation of and commentary on Isaac Newton's book Principia containing basic laws of physics. https://en.wikipedia.org/wiki/%C3%89milie_du_Ch%C3%A2telet"
-    ),
-    _("chatterjee"): _(
-        "Asima Chatterjee was an Indian organic chemist noted for her research on vinca alkaloids, development of drugs for treatment of epilepsy and malaria - https://en.wikipedia.org/wiki/Asima_Chatterjee"
-    ),
-    _("chebyshev"): _(
-        "Pafnuty Chebyshev - Russian mathematician. He is known fo his works on probability, statistics, mechanics, analytical geometry and number theory https://en.wikipedia.org/wiki/Pafnuty_Chebyshev"
-    ),
-    _("cohen"): _(
-        "Bram Cohen - American computer programmer and author of the BitTorrent peer-to-peer protocol. https://en.wikipedia.org/wiki/Bram_Cohen"
-    ),
-    _("chaum"): _(
-        "David Lee Chaum - American computer scientist and cryptographer. Known for his seminal contributions in the field of anonymous communication. https://en.wikipedia.org/wiki/David_Chaum"
-    ),
-    _("clarke"): _(
-        "Joan Clarke - Bletchley Park code breaker during the Second World War who pioneered techniques that remained top secret for decades. Also an accomplished numismatist https://en.wikipedia.org/wiki/Joan_Clarke"
-    ),
-    _("colden"): _(
-        "Jane Colden - American botanist widely considered the first female American botanist - https://en.wikipedia.org/wiki/Jane_Colden"
-    ),
-    _("cori"): _(
-        "Gerty Theresa Cori - American biochemist who became the third woman—and first American woman—to win a Nobel Prize in science, and the first woman to be awarded the Nobel Prize in Physiology or Medicine. Cori was born in Prague. https://en.wikipedia.org/wiki/Gerty_Cori"
-    ),
-    _("cray"): _(
-        "Seymour Roger Cray was an American electrical engineer and supercomputer architect who designed a series of computers that were the fastest in the world for decades. https://en.wikipedia.org/wiki/Seymour_Cray"
-    ),
-    _("curran"): _(
-        "This entry reflects a husband and wife team who worked together:\n"
-        "Samuel Curran was an Irish physicist who worked alongside his wife during WWII and invented the proximity fuse. https://en.wikipedia.org/wiki/Samuel_Curran\n"
-        "Joan Curran was a Welsh scientist who developed radar and invented chaff, a radar countermeasure. https://en.wikipedia.org/wiki/Joan_Curran"
-    ),
-    "curie": _(
-        "Marie Curie discovered radioactivity. https://en.wikipedia.org/wiki/Marie_Curie."
-    ),
-    _("darwin"): _(
-        "Charles Darwin established the principles of natural evolution. https://en.wikipedia.org/wiki/Charles_Darwin."
-    ),
-    _("davinci"): _(
-        "Leonardo Da Vinci invented too many things to list here. https://en.wikipedia.org/wiki/Leonardo_da_Vinci."
-    ),
-    _("dewdney"): _(
-        "A. K. (Alexander Keewatin) Dewdney, Canadian mathematician, computer scientist, author and filmmaker. Contributor to Scientific American's 'Computer Recreations' from 1984 to 1991. Author of Core War (program), The Planiverse, The Armchair Universe, The Magic Machine, The New Turing Omnibus, and more. https://en.wikipedia.org/wiki/Alexander_Dewdney"
-    ),
-    _("dhawan"): _(
-        "Satish Dhawan - Indian mathematician and aerospace engineer, known for leading the successful and indigenous development of the Indian space programme. https://en.wikipedia.org/wiki/Satish_Dhawan"
-    ),
-    _("diffie"): _(
-        "Bailey Whitfield Diffie - American cryptographer and one of the pioneers of public-key cryptography. https://en.wikipedia.org/wiki/Whitfield_Diffie"
-    ),
-    _("dijkstra"): _(
-        "Edsger Wybe Dijkstra was a Dutch computer scientist and mathematical scientist. https://en.wikipedia.org/wiki/Edsger_W._Dijkstra."
-    ),
-    _("dirac"): _(
-        "Paul Adrien Maurice Dirac - English theoretical physicist who made fundamental contributions to the early development of both quantum mechanics and quantum electrodynamics. https://en.wikipedia.org/wiki/Paul_Dirac"
-    ),
-    _("driscoll"): _(
-        "Agnes Meyer Driscoll - American cryptanalyst during World Wars I and II who successfully cryptanalysed a number of Japanese ciphers. She was also the co-developer of one of the cipher machines of the US Navy, the CM. https://en.wikipedia.org/wiki/Agnes_Meyer_Driscoll"
-    ),
-    _("dubinsky"): _(
-        "Donna Dubinsky - played an integral role in the development of personal digital assistants (PDAs) serving as CEO of Palm, Inc. and co-founding Handspring. https://en.wikipedia.org/wiki/Donna_Dubinsky"
-    ),
-    _("easley"): _(
-        "Annie Easley - She was a leading member of the team which developed software for the Centaur rocket stage and one of the first African-Americans in her field. https://en.wikipedia.org/wiki/Annie_Easley"
-    ),
-    _("edison"): _(
-        "Thomas Alva Edison, prolific inventor https://en.wikipedia.org/wiki/Thomas_Edison"
-    ),
-    _("einstein"): _(
-        "Albert Einstein invented the general theory of relativity. https://en.wikipedia.org/wiki/Albert_Einstein"
-    ),
-    _("elbakyan"): _(
-        "Alexandra Asanovna Elbakyan (Russian: Алекса́ндра Аса́новна Элбакя́н) is a Kazakhstani graduate student, computer programmer, internet pirate in hiding, and the creator of the site Sci-Hub. Nature has listed her in 2016 in the top ten people that mattered in science, and Ars Technica has compared her to Aaron Swartz. - https://en.wikipedia.org/wiki/Alexandra_Elbakyan"
-    ),
-    _("elgamal"): _(
-        "Taher A. ElGamal - Egyptian cryptographer best known for the ElGamal discrete log cryptosystem and the ElGamal digital signature scheme. https://en.wikipedia.org/wiki/Taher_Elgamal"
-    ),
-    _("elion"): _(
-        "Gertrude Elion - American biochemist, pharmacologist and the 1988 recipient of the Nobel Prize in Medicine - https://en.wikipedia.org/wiki/Gertrude_Elion"
-    ),
-    _("ellis"): _(
-        "James Henry Ellis - British engineer and cryptographer employed by the GCHQ. Best known for conceiving for the first time, the idea of public-key cryptography. https://en.wikipedia.org/wiki/James_H._Ellis"
-    ),
-    _("engelbart"): _(
-        "Douglas Engelbart gave the mother of all demos: https://en.wikipedia.org/wiki/Douglas_Engelbart"
-    ),
-    _("euclid"): _("Euclid invented geometry. https://en.wikipedia.org/wiki/Euclid"),
-    _("euler"): _(
-        "Leonhard Euler invented large parts of modern mathematics. https://de.wikipedia.org/wiki/Leonhard_Euler"
-    ),
-    _("faraday"): _(
-        "Michael Faraday - British scientist who contributed to the study of electromagnetism and electrochemistry. https://en.wikipedia.org/wiki/Michael_Faraday"
-    ),
-    _("feistel"): _(
-        "Horst Feistel - German-born American cryptographer who was one of the earliest non-government researchers to study the design and theory of block ciphers. Co-developer of DES and Lucifer. Feistel networks, a symmetric structure used in the construction of block ciphers are named after him. https://en.wikipedia.org/wiki/Horst_Feistel"
-    ),
-    _("fermat"): _(
-        "Pierre de Fermat pioneered several aspects of modern mathematics. https://en.wikipedia.org/wiki/Pierre_de_Fermat"
-    ),
-    _("fermi"): _(
-        "Enrico Fermi invented the first nuclear reactor. https://en.wikipedia.org/wiki/Enrico_Fermi."
-    ),
-    _("feynman"): _(
-        "Richard Feynman was a key contributor to quantum mechanics and particle physics. https://en.wikipedia.org/wiki/Richard_Feynman"
-    ),
-    _("franklin"): _(
-        "Benjamin Franklin is famous for his experiments in electricity and the invention of the lightning rod."
-    ),
-    _("gagarin"): _(
-        "Yuri Alekseyevich Gagarin - Soviet pilot and cosmonaut, best known as the first human to journey into outer space. https://en.wikipedia.org/wiki/Yuri_Gagarin"
-    ),
-    _("galileo"): _(
-        "Galileo was a founding father of modern astronomy, and faced politics and obscurantism to establish scientific truth.  https://en.wikipedia.org/wiki/Galileo_Galilei"
-    ),
-    _("galois"): _(
-        "Évariste Galois - French mathematician whose work laid the foundations of Galois theory and group theory, two major branches of abstract algebra, and the subfield of Galois connections, all while still in his late teens. https://en.wikipedia.org/wiki/%C3%89variste_Galois"
-    ),
-    _("ganguly"): _(
-        "Kadambini Ganguly - Indian physician, known for being the first South Asian female physician, trained in western medicine, to graduate in South Asia. https://en.wikipedia.org/wiki/Kadambini_Ganguly"
-    ),
-    _("gates"): _(
-        "William Henry 'Bill' Gates III is an American business magnate, philanthropist, investor, computer programmer, and inventor. https://en.wikipedia.org/wiki/Bill_Gates"
-    ),
-    _("gauss"): _(
-        "Johann Carl Friedrich Gauss - German mathematician who made significant contributions to many fields, including number theory, algebra, statistics, analysis, differential geometry, geodesy, geophysics, mechanics, electrostatics, magnetic fields, astronomy, matrix theory, and optics. https://en.wikipedia.org/wiki/Carl_Friedrich_Gauss"
-    ),
-    _("germain"): _(
-        "Marie-Sophie Germain - French mathematician, physicist and philosopher. Known for her work on elasticity theory, number theory and philosophy. https://en.wikipedia.org/wiki/Sophie_Germain"
-    ),
-    _("goldberg"): _(
-        "Adele Goldberg, was one of the designers and developers of the Smalltalk language. https://en.wikipedia.org/wiki/Adele_Goldberg_(computer_scientist)"
-    ),
-    _("goldstine"): _(
-        "Adele Goldstine, born Adele Katz, wrote the complete technical description for the first electronic digital computer, ENIAC. https://en.wikipedia.org/wiki/Adele_Goldstine"
-    ),
-    _("goldwasser"): _(
-        "Shafi Goldwasser is a computer scientist known for creating theoretical foundations of modern cryptography. Winner of 2012 ACM Turing Award. https://en.wikipedia.org/wiki/Shafi_Goldwasser"
-    ),
-    _("golick"): _("James Golick, all around gangster."),
-    _("goodall"): _(
-        "Jane Goodall - British primatologist, ethologist, and anthropologist who is considered to be the world's foremost expert on chimpanzees - https://en.wikipedia.org/wiki/Jane_Goodall"
-    ),
-    _("gould"): _(
-        "Stephen Jay Gould was was an American paleontologist, evolutionary biologist, and historian of science. He is most famous for the theory of punctuated equilibrium - https://en.wikipedia.org/wiki/Stephen_Jay_Gould"
-    ),
-    _("greider"): _(
-        "Carolyn Widney Greider - American molecular biologist and joint winner of the 2009 Nobel Prize for Physiology or Medicine for the discovery of telomerase. https://en.wikipedia.org/wiki/Carol_W._Greider"
-    ),
-    _("grothendieck"): _(
-        "Alexander Grothendieck - German-born French mathematician who became a leading figure in the creation of modern algebraic geometry. https://en.wikipedia.org/wiki/Alexander_Grothendieck"
-    ),
-    _("haibt"): _(
-        "Lois Haibt - American computer scientist, part of the team at IBM that developed FORTRAN - https://en.wikipedia.org/wiki/Lois_Haibt"
-    ),
-    _("hamilton"): _(
-        "Margaret Hamilton - Director of the Software Engineering Division of the MIT Instrumentation Laboratory, which developed on-board flight software for the Apollo space program. https://en.wikipedia.org/wiki/Margaret_Hamilton_(scientist)"
-    ),
-    _("haslett"): _(
-        "Caroline Harriet Haslett - English electrical engineer, electricity industry administrator and champion of women's rights. Co-author of British Standard 1363 that specifies AC power plugs and sockets used across the United Kingdom (which is widely considered as one of the safest designs). https://en.wikipedia.org/wiki/Caroline_Haslett"
-    ),
-    _("hawking"): _(
-        "Stephen Hawking pioneered the field of cosmology by combining general relativity and quantum mechanics. https://en.wikipedia.org/wiki/Stephen_Hawking"
-    ),
-    _("hellman"): _(
-        "Martin Edward Hellman - American cryptologist, best known for his invention of public-key cryptography in co-operation with Whitfield Diffie and Ralph Merkle. https://en.wikipedia.org/wiki/Martin_Hellman"
-    ),
-    _("heisenberg"): _(
-        "Werner Heisenberg was a founding father of quantum mechanics. https://en.wikipedia.org/wiki/Werner_Heisenberg"
-    ),
-    _("hermann"): _(
-        "Grete Hermann was a German philosopher noted for her philosophical work on the foundations of quantum mechanics. https://en.wikipedia.org/wiki/Grete_Hermann"
-    ),
-    _("herschel"): _(
-        "Caroline Lucretia Herschel - German astronomer and discoverer of several comets. https://en.wikipedia.org/wiki/Caroline_Herschel"
-    ),
-    _("hertz"): _(
-        "Heinrich Rudolf Hertz - German physicist who first conclusively proved the existence of the electromagnetic waves. https://en.wikipedia.org/wiki/Heinrich_Hertz"
-    ),
-    _("heyrovsky"): _(
-        "Jaroslav Heyrovský was the inventor of the polarographic method, father of the electroanalytical method, and recipient of the Nobel Prize in 1959. His main field of work was polarography. https://en.wikipedia.org/wiki/Jaroslav_Heyrovsk%C3%BD"
-    ),
-    _("hodgkin"): _(
-        "Dorothy Hodgkin was a British biochemist, credited with the development of protein crystallography. She was awarded the Nobel Prize in Chemistry in 1964. https://en.wikipedia.org/wiki/Dorothy_Hodgkin"
-    ),
-    _("hofstadter"): _(
-        "Douglas R. Hofstadter is an American professor of cognitive science and author of the Pulitzer Prize and American Book Award-winning work Goedel, Escher, Bach: An Eternal Golden Braid in 1979. A mind-bending work which coined Hofstadter's Law: 'It always takes longer than you expect, even when you take into account Hofstadter's Law.' https://en.wikipedia.org/wiki/Douglas_Hofstadter"
-    ),
-    _("hoover"): _(
-        "Erna Schneider Hoover revolutionized modern communication by inventing a computerized telephone switching method. https://en.wikipedia.org/wiki/Erna_Schneider_Hoover"
-    ),
-    _("hopper"): _(
-        "Grace Hopper developed the first compiler for a computer programming language and  is credited with popularizing the term 'debugging' for fixing computer glitches. https://en.wikipedia.org/wiki/Grace_Hopper"
-    ),
-    _("hugle"): _(
-        "Frances Hugle, she was an American scientist, engineer, and inventor who contributed to the understanding of semiconductors, integrated circuitry, and the unique electrical principles of microscopic materials. https://en.wikipedia.org/wiki/Frances_Hugle"
-    ),
-    _("hypatia"): _(
-        "Hypatia - Greek Alexandrine Neoplatonist philosopher in Egypt who was one of the earliest mothers of mathematics - https://en.wikipedia.org/wiki/Hypatia"
-    ),
-    _("ishizaka"): _(
-        "Teruko Ishizaka - Japanese scientist and immunologist who co-discovered the antibody class Immunoglobulin E. https://en.wikipedia.org/wiki/Teruko_Ishizaka"
-    ),
-    _("jackson"): _(
-        "Mary Jackson, American mathematician and aerospace engineer who earned the highest title within NASA's engineering department - https://en.wikipedia.org/wiki/Mary_Jackson_(engineer)"
-    ),
-    _("jang"): _(
-        "Yeong-Sil Jang was a Korean scientist and astronomer during the Joseon Dynasty; he invented the first metal printing press and water gauge. https://en.wikipedia.org/wiki/Jang_Yeong-sil"
-    ),
-    _("jennings"): _(
-        "Betty Jennings - one of the original programmers of the ENIAC. https://en.wikipedia.org/wiki/ENIAC - https://en.wikipedia.org/wiki/Jean_Bartik"
-    ),
-    _("jepsen"): _(
-        "Mary Lou Jepsen, was the founder and chief technology officer of One Laptop Per Child (OLPC), and the founder of Pixel Qi. https://en.wikipedia.org/wiki/Mary_Lou_Jepsen"
-    ),
-    _("johnson"): _(
-        "Katherine Coleman Goble Johnson - American physicist and mathematician contributed to the NASA. https://en.wikipedia.org/wiki/Katherine_Johnson"
-    ),
-    _("joliot"): _(
-        "Irène Joliot-Curie - French scientist who was awarded the Nobel Prize for Chemistry in 1935. Daughter of Marie and Pierre Curie. https://en.wikipedia.org/wiki/Ir%C3%A8ne_Joliot-Curie"
-    ),
-    _("jones"): _(
-        "Karen Spärck Jones came up with the concept of inverse document frequency, which is used in most search engines today. https://en.wikipedia.org/wiki/Karen_Sp%C3%A4rck_Jones"
-    ),
-    _("kalam"): _(
-        "A. P. J. Abdul Kalam - is an Indian scientist aka Missile Man of India for his work on the development of ballistic missile and launch vehicle technology - https://en.wikipedia.org/wiki/A._P._J._Abdul_Kalam"
-    ),
-    _("kapitsa"): _(
-        "Sergey Petrovich Kapitsa (Russian: Серге́й Петро́вич Капи́ца; 14 February 1928 – 14 August 2012) was a Russian physicist and demographer. He was best known as host of the popular and long-running Russian scientific TV show, Evident, but Incredible. His father was the Nobel laureate Soviet-era physicist Pyotr Kapitsa, and his brother was the geographer and Antarctic explorer Andrey Kapitsa. - https://en.wikipedia.org/wiki/Sergey_Kapitsa"
-    ),
-    _("kare"): _(
-        "Susan Kare, created the icons and many of the interface elements for the original Apple Macintosh in the 1980s, and was an original employee of NeXT, working as the Creative Director. https://en.wikipedia.org/wiki/Susan_Kare"
-    ),
-    _("keldysh"): _(
-        "Mstislav Keldysh - a Soviet scientist in the field of mathematics and mechanics, academician of the USSR Academy of Sciences (1946), President of the USSR Academy of Sciences (1961–1975), three times Hero of Socialist Labor (1956, 1961, 1971), fellow of the Royal Society of Edinburgh (1968). https://en.wikipedia.org/wiki/Mstislav_Keldysh"
-    ),
-    _("keller"): _(
-        "Mary Kenneth Keller, Sister Mary Kenneth Keller became the first American woman to earn a PhD in Computer Science in 1965. https://en.wikipedia.org/wiki/Mary_Kenneth_Keller"
-    ),
-    _("kepler"): _(
-        "Johannes Kepler, German astronomer known for his three laws of planetary motion - https://en.wikipedia.org/wiki/Johannes_Kepler"
-    ),
-    _("khayyam"): _(
-        "Omar Khayyam - Persian mathematician, astronomer and poet. Known for his work on the classification and solution of cubic equations, for his contribution to the understanding of Euclid's fifth postulate and for computing the length of a year very accurately. https://en.wikipedia.org/wiki/Omar_Khayyam"
-    ),
-    _("khorana"): _(
-        "Har Gobind Khorana - Indian-American biochemist who shared the 1968 Nobel Prize for Physiology - https://en.wikipedia.org/wiki/Har_Gobind_Khorana"
-    ),
-    _("kilby"): _(
-        "Jack Kilby invented silicone integrated circuits and gave Silicon Valley its name. - https://en.wikipedia.org/wiki/Jack_Kilby"
-    ),
-    _("kirch"): _(
-        "Maria Kirch - German astronomer and first woman to discover a comet - https://en.wikipedia.org/wiki/Maria_Margarethe_Kirch"
-    ),
-    _("knuth"): _(
-        "Donald Knuth - American computer scientist, author of 'The Art of Computer Programming' and creator of the TeX typesetting system. https://en.wikipedia.org/wiki/Donald_Knuth"
-    ),
-    _("kowalevski"): _(
-        "Sophie Kowalevski - Russian mathematician responsible for important original contributions to analysis, differential equations and mechanics - https://en.wikipedia.org/wiki/Sofia_Kovalevskaya"
-    ),
-    _("lalande"): _(
-        "Marie-Jeanne de Lalande - French astronomer, mathematician and cataloguer of stars - https://en.wikipedia.org/wiki/Marie-Jeanne_de_Lalande"
-    ),
-    _("lamarr"): _(
-        "Hedy Lamarr - Actress and inventor. The principles of her work are now incorporated into modern Wi-Fi, CDMA and Bluetooth technology. https://en.wikipedia.org/wiki/Hedy_Lamarr"
-    ),
-    _("lamport"): _(
-        "Leslie B. Lamport - American computer scientist. Lamport is best known for his seminal work in distributed systems and was the winner of the 2013 Turing Award. https://en.wikipedia.org/wiki/Leslie_Lamport"
-    ),
-    _("leakey"): _(
-        "Mary Leakey - British paleoanthropologist who discovered the first fossilized Proconsul skull - https://en.wikipedia.org/wiki/Mary_Leakey"
-    ),
-    _("leavitt"): _(
-        "Henrietta Swan Leavitt - she was an American astronomer who discovered the relation between the luminosity and the period of Cepheid variable stars. https://en.wikipedia.org/wiki/Henrietta_Swan_Leavitt"
-    ),
-    _("lederberg"): _(
-        "Esther Miriam Zimmer Lederberg - American microbiologist and a pioneer of bacterial genetics. https://en.wikipedia.org/wiki/Esther_Lederberg"
-    ),
-    _("lehmann"): _(
-        "Inge Lehmann - Danish seismologist and geophysicist. Known for discovering in 1936 that the Earth has a solid inner core inside a molten outer core. https://en.wikipedia.org/wiki/Inge_Lehmann"
-    ),
-    _("lewin"): _(
-        "Daniel Lewin - Mathematician, Akamai co-founder, soldier, 9/11 victim-- Developed optimization techniques for routing traffic on the internet. Died attempting to stop the 9-11 hijackers. https://en.wikipedia.org/wiki/Daniel_Lewin"
-    ),
-    _("lichterman"): _(
-        "Ruth Lichterman - one of the original programmers of the ENIAC. https://en.wikipedia.org/wiki/ENIAC - https://en.wikipedia.org/wiki/Ruth_Teitelbaum"
-    ),
-    _("liskov"): _(
-        "Barbara Liskov - co-developed the Liskov substitution principle. Liskov was also the winner of the Turing Prize in 2008. - https://en.wikipedia.org/wiki/Barbara_Liskov"
-    ),
-    _("lovelace"): _(
-        "Ada Lovelace invented the first algorithm. https://en.wikipedia.org/wiki/Ada_Lovelace (thanks James Turnbull)"
-    ),
-    _("lumiere"): _(
-        "Auguste and Louis Lumière - the first filmmakers in history - https://en.wikipedia.org/wiki/Auguste_and_Louis_Lumi%C3%A8re"
-    ),
-    _("mahavira"): _(
-        "Mahavira - Ancient Indian mathematician during 9th century AD who discovered basic algebraic identities - https://en.wikipedia.org/wiki/Mah%C4%81v%C4%ABra_(mathematician)"
-    ),
-    _("margulis"): _(
-        "Lynn Margulis (b. Lynn Petra Alexander) - an American evolutionary theorist and biologist, science author, educator, and popularizer, and was the primary modern proponent for the significance of symbiosis in evolution. - https://en.wikipedia.org/wiki/Lynn_Margulis"
-    ),
-    _("matsumoto"): _(
-        "Yukihiro Matsumoto - Japanese computer scientist and software programmer best known as the chief designer of the Ruby programming language. https://en.wikipedia.org/wiki/Yukihiro_Matsumoto"
-    ),
-    _("maxwell"): _(
-        "James Clerk Maxwell - Scottish physicist, best known for his formulation of electromagnetic theory. https://en.wikipedia.org/wiki/James_Clerk_Maxwell"
-    ),
-    _("mayer"): _(
-        "Maria Mayer - American theoretical physicist and Nobel laureate in Physics for proposing the nuclear shell model of the atomic nucleus - https://en.wikipedia.org/wiki/Maria_Mayer"
-    ),
-    _("mccarthy"): _(
-        "John McCarthy invented LISP: https://en.wikipedia.org/wiki/John_McCarthy_(computer_scientist)"
-    ),
-    _("mcclintock"): _(
-        "Barbara McClintock - a distinguished American cytogeneticist, 1983 Nobel Laureate in Physiology or Medicine for discovering transposons. https://en.wikipedia.org/wiki/Barbara_McClintock"
-    ),
-    _("mclaren"): _(
-        "Anne Laura Dorinthea McLaren - British developmental biologist whose work helped lead to human in-vitro fertilisation. https://en.wikipedia.org/wiki/Anne_McLaren"
-    ),
-    _("mclean"): _(
-        "Malcolm McLean invented the modern shipping container: https://en.wikipedia.org/wiki/Malcom_McLean"
-    ),
-    _("mcnulty"): _(
-        "Kay McNulty - one of the original programmers of the ENIAC. https://en.wikipedia.org/wiki/ENIAC - https://en.wikipedia.org/wiki/Kathleen_Antonelli"
-    ),
-    _("mendel"): _(
-        "Gregor Johann Mendel - Czech scientist and founder of genetics. https://en.wikipedia.org/wiki/Gregor_Mendel"
-    ),
-    _("mendeleev"): _(
-        "Dmitri Mendeleev - a chemist and inventor. He formulated the Periodic Law, created a farsighted version of the periodic table of elements, and used it to correct the properties of some already discovered elements and also to predict the properties of eight elements yet to be discovered. https://en.wikipedia.org/wiki/Dmitri_Mendeleev"
-    ),
-    _("meitner"): _(
-        "Lise Meitner - Austrian/Swedish physicist who was involved in the discovery of nuclear fission. The element meitnerium is named after her - https://en.wikipedia.org/wiki/Lise_Meitner"
-    ),
-    _("meninsky"): _(
-        "Carla Meninsky, was the game designer and programmer for Atari 2600 games Dodge Em and Warlords.https: // en.wikipedia.org / wiki / Carla_Meninsky"
-    ),
-    _("merkle"): _(
-        "Ralph C. Merkle - American computer scientist, known for devising Merkle's puzzles - one of the very first schemes for public-key cryptography. Also, inventor of Merkle trees and co-inventor of the Merkle-Damgård construction for building collision-resistant cryptographic hash functions and the Merkle-Hellman knapsack cryptosystem. https://en.wikipedia.org/wiki/Ralph_Merkle"
-    ),
-    _("mestorf"): _(
-        "Johanna Mestorf - German prehistoric archaeologist and first female museum director in Germany - https://en.wikipedia.org/wiki/Johanna_Mestorf"
-    ),
-    _("minsky"): _(
-        "Marvin Minsky - Pioneer in Artificial Intelligence, co-founder of the MIT's AI Lab, won the Turing Award in 1969. https://en.wikipedia.org/wiki/Marvin_Minsky"
-    ),
-    _("mirzakhani"): _(
-        "Maryam Mirzakhani - an Iranian mathematician and the first woman to win the Fields Medal. https://en.wikipedia.org/wiki/Maryam_Mirzakhani"
-    ),
-    _("moore"): _(
-        "Gordon Earle Moore - American engineer, Silicon Valley founding father, author of Moore's law. https://en.wikipedia.org/wiki/Gordon_Moore"
-    ),
-    _("morse"): _(
-        "Samuel Morse - contributed to the invention of a single-wire telegraph system based on European telegraphs and was a co-developer of the Morse code - https://en.wikipedia.org/wiki/Samuel_Morse"
-    ),
-    _("murdock"): _(
-        "Ian Murdock - founder of the Debian project - https://en.wikipedia.org/wiki/Ian_Murdock"
-    ),
-    _("moser"): _(
-        "May-Britt Moser - Nobel prize winner neuroscientist who contributed to the discovery of grid cells in the brain. https://en.wikipedia.org/wiki/May-Britt_Moser"
-    ),
-    _("napier"): _(
-        "John Napier of Merchiston - Scottish landowner known as an astronomer, mathematician and physicist. Best known for his discovery of logarithms. https://en.wikipedia.org/wiki/John_Napier"
-    ),
-    _("nash"): _(
-        "John Forbes Nash, Jr. - American mathematician who made fundamental contributions to game theory, differential geometry, and the study of partial differential equations. https://en.wikipedia.org/wiki/John_Forbes_Nash_Jr."
-    ),
-    _("neumann"): _(
-        "John von Neumann - todays computer architectures are based on the von Neumann architecture. https://en.wikipedia.org/wiki/Von_Neumann_architecture"
-    ),
-    _("newton"): _(
-        "Isaac Newton invented classic mechanics and modern optics. https://en.wikipedia.org/wiki/Isaac_Newton"
-    ),
-    _("nightingale"): _(
-        "Florence Nightingale, more prominently known as a nurse, was also the first female member of the Royal Statistical Society and a pioneer in statistical graphics https://en.wikipedia.org/wiki/Florence_Nightingale#Statistics_and_sanitary_reform"
-    ),
-    _("nobel"): _(
-        "Alfred Nobel - a Swedish chemist, engineer, innovator, and armaments manufacturer (inventor of dynamite) - https://en.wikipedia.org/wiki/Alfred_Nobel"
-    ),
-    _("noether"): _(
-        "Emmy Noether, German mathematician. Noether's Theorem is named after her. https://en.wikipedia.org/wiki/Emmy_Noether"
-    ),
-    _("northcutt"): _(
-        "Poppy Northcutt. Poppy Northcutt was the first woman to work as part of NASA’s Mission Control. http://www.businessinsider.com/poppy-northcutt-helped-apollo-astronauts-2014-12?op=1"
-    ),
-    _("noyce"): _(
-        "Robert Noyce invented silicone integrated circuits and gave Silicon Valley its name. - https://en.wikipedia.org/wiki/Robert_Noyce"
-    ),
-    _("panini"): _(
-        "Panini - Ancient Indian linguist and grammarian from 4th century CE who worked on the world's first formal system - https://en.wikipedia.org/wiki/P%C4%81%E1%B9%87ini#Comparison_with_modern_formal_systems"
-    ),
-    _("pare"): _(
-        "Ambroise Pare invented modern surgery. https://en.wikipedia.org/wiki/Ambroise_Par%C3%A9"
-    ),
-    _("pascal"): _(
-        "Blaise Pascal, French mathematician, physicist, and inventor - https://en.wikipedia.org/wiki/Blaise_Pascal"
-    ),
-    _("pasteur"): _(
-        "Louis Pasteur discovered vaccination, fermentation and pasteurization. https://en.wikipedia.org/wiki/Louis_Pasteur."
-    ),
-    _("payne"): _(
-        "Cecilia Payne-Gaposchkin was an astronomer and astrophysicist who, in 1925, proposed in her Ph.D. thesis an explanation for the composition of stars in terms of the relative abundances of hydrogen and helium. https://en.wikipedia.org/wiki/Cecilia_Payne-Gaposchkin"
-    ),
-    _("perlman"): _(
-        "Radia Perlman is a software designer and network engineer and most famous for her invention of the spanning-tree protocol (STP). https://en.wikipedia.org/wiki/Radia_Perlman"
-    ),
-    _("pike"): _(
-        "Rob Pike was a key contributor to Unix, Plan 9, the X graphic system, utf-8, and the Go programming language. https://en.wikipedia.org/wiki/Rob_Pike"
-    ),
-    _("poincare"): _(
-        "Henri Poincaré made fundamental contributions in several fields of mathematics. https://en.wikipedia.org/wiki/Henri_Poincar%C3%A9"
-    ),
-    _("poitras"): _(
-        "Laura Poitras is a director and producer whose work, made possible by open source crypto tools, advances the causes of truth and freedom of information by reporting disclosures by whistleblowers such as Edward Snowden. https://en.wikipedia.org/wiki/Laura_Poitras"
-    ),
-    _("proskuriakova"): _(
-        "Tat’yana Avenirovna Proskuriakova (Russian: Татья́на Авени́ровна Проскуряко́ва) (January 23 [O.S. January 10] 1909 – August 30, 1985) was a Russian-American Mayanist scholar and archaeologist who contributed significantly to the deciphering of Maya hieroglyphs, the writing system of the pre-Columbian Maya civilization of Mesoamerica. https://en.wikipedia.org/wiki/Tatiana_Proskouriakoff"
-    ),
-    _("ptolemy"): _(
-        "Claudius Ptolemy - a Greco-Egyptian writer of Alexandria, known as a mathematician, astronomer, geographer, astrologer, and poet of a single epigram in the Greek Anthology - https://en.wikipedia.org/wiki/Ptolemy"
-    ),
-    _("raman"): _(
-        "C. V. Raman - Indian physicist who won the Nobel Prize in 1930 for proposing the Raman effect. - https://en.wikipedia.org/wiki/C._V._Raman"
-    ),
-    _("ramanujan"): _(
-        "Srinivasa Ramanujan - Indian mathematician and autodidact who made extraordinary contributions to mathematical analysis, number theory, infinite series, and continued fractions. - https://en.wikipedia.org/wiki/Srinivasa_Ramanujan"
-    ),
-    _("ride"): _(
-        "Sally Kristen Ride was an American physicist and astronaut. She was the first American woman in space, and the youngest American astronaut. https://en.wikipedia.org/wiki/Sally_Ride"
-    ),
-    _("montalcini"): _(
-        "Rita Levi-Montalcini - Won Nobel Prize in Physiology or Medicine jointly with colleague Stanley Cohen for the discovery of nerve growth factor (https://en.wikipedia.org/wiki/Rita_Levi-Montalcini)"
-    ),
-    _("ritchie"): _(
-        "Dennis Ritchie - co-creator of UNIX and the C programming language. - https://en.wikipedia.org/wiki/Dennis_Ritchie"
-    ),
-    _("rhodes"): _(
-        "Ida Rhodes - American pioneer in computer programming, designed the first computer used for Social Security. https://en.wikipedia.org/wiki/Ida_Rhodes"
-    ),
-    _("robinson"): _(
-        "Julia Hall Bowman Robinson - American mathematician renowned for her contributions to the fields of computability theory and computational complexity theory. https://en.wikipedia.org/wiki/Julia_Robinson"
-    ),
-    _("roentgen"): _(
-        "Wilhelm Conrad Röntgen - German physicist who was awarded the first Nobel Prize in Physics in 1901 for the discovery of X-rays (Röntgen rays). https://en.wikipedia.org/wiki/Wilhelm_R%C3%B6ntgen"
-    ),
-    _("rosalind"): _(
-        "Rosalind Franklin - British biophysicist and X-ray crystallographer whose research was critical to the understanding of DNA - https://en.wikipedia.org/wiki/Rosalind_Franklin"
-    ),
-    _("rubin"): _(
-        "Vera Rubin - American astronomer who pioneered work on galaxy rotation rates. https://en.wikipedia.org/wiki/Vera_Rubin"
-    ),
-    _("saha"): _(
-        "Meghnad Saha - Indian astrophysicist best known for his development of the Saha equation, used to describe chemical and physical conditions in stars - https://en.wikipedia.org/wiki/Meghnad_Saha"
-    ),
-    _("sammet"): _(
-        "Jean E. Sammet developed FORMAC, the first widely used computer language for symbolic manipulation of mathematical formulas. https://en.wikipedia.org/wiki/Jean_E._Sammet"
-    ),
-    _("sanderson"): _(
-        "Mildred Sanderson - American mathematician best known for Sanderson's theorem concerning modular invariants. https://en.wikipedia.org/wiki/Mildred_Sanderson"
-    ),
-    _("shamir"): _(
-        "Adi Shamir - Israeli cryptographer whose numerous inventions and contributions to cryptography include the Ferge Fiat Shamir identification scheme, the Rivest Shamir Adleman (RSA) public-key cryptosystem, the Shamir's secret sharing scheme, the breaking of the Merkle-Hellman cryptosystem, the TWINKLE and TWIRL factoring devices and the discovery of differential cryptanalysis (with Eli Biham). https://en.wikipedia.org/wiki/Adi_Shamir"
-    ),
-    _("shannon"): _(
-        "Claude Shannon - The father of information theory and founder of digital circuit design theory. (https://en.wikipedia.org/wiki/Claude_Shannon)"
-    ),
-    _("shaw"): _(
-        "Carol Shaw - Originally an Atari employee, Carol Shaw is said to be the first female video game designer. https://en.wikipedia.org/wiki/Carol_Shaw_(video_game_designer)"
-    ),
-    _("shirley"): _(
-        "Dame Stephanie 'Steve' Shirley - Founded a software company in 1962 employing women working from home. https://en.wikipedia.org/wiki/Steve_Shirley"
-    ),
-    _("shockley"): _(
-        "William Shockley co-invented the transistor - https://en.wikipedia.org/wiki/William_Shockley"
-    ),
-    _("shtern"): _(
-        "Lina Solomonovna Stern (or Shtern; Russian: Лина Соломоновна Штерн; 26 August 1878 – 7 March 1968) was a Soviet biochemist, physiologist and humanist whose medical discoveries saved thousands of lives at the fronts of World War II. She is best known for her pioneering work on blood–brain barrier, which she described as hemato-encephalic barrier in 1921. https://en.wikipedia.org/wiki/Lina_Stern"
-    ),
-    _("sinoussi"): _(
-        "Françoise Barré-Sinoussi - French virologist and Nobel Prize Laureate in Physiology or Medicine; her work was fundamental in identifying HIV as the cause of AIDS. https://en.wikipedia.org/wiki/Fran%C3%A7oise_Barr%C3%A9-Sinoussi"
-    ),
-    _("snyder"): _(
-        "Betty Snyder - one of the original programmers of the ENIAC. https://en.wikipedia.org/wiki/ENIAC - https://en.wikipedia.org/wiki/Betty_Holberton"
-    ),
-    _("solomon"): _(
-        "Cynthia Solomon - Pioneer in the fields of artificial intelligence, computer science and educational computing. Known for creation of Logo, an educational programming language.  https://en.wikipedia.org/wiki/Cynthia_Solomon"
-    ),
-    _("spence"): _(
-        "Frances Spence - one of the original programmers of the ENIAC. https://en.wikipedia.org/wiki/ENIAC - https://en.wikipedia.org/wiki/Frances_Spence"
-    ),
-    _("stallman"): _(
-        "Richard Matthew Stallman - the founder of the Free Software movement, the GNU project, the Free Software Foundation, and the League for Programming Freedom. He also invented the concept of copyleft to protect the ideals of this movement, and enshrined this concept in the widely-used GPL (General Public License) for software. https://en.wikiquote.org/wiki/Richard_Stallman"
-    ),
-    _("stonebraker"): _(
-        "Michael Stonebraker is a database research pioneer and architect of Ingres, Postgres, VoltDB and SciDB. Winner of 2014 ACM Turing Award. https://en.wikipedia.org/wiki/Michael_Stonebraker"
-    ),
-    _("sutherland"): _(
-        "Ivan Edward Sutherland - American computer scientist and Internet pioneer, widely regarded as the father of computer graphics. https://en.wikipedia.org/wiki/Ivan_Sutherland"
-    ),
-    _("swanson"): _(
-        "Janese Swanson (with others) developed the first of the Carmen Sandiego games. She went on to found Girl Tech. https://en.wikipedia.org/wiki/Janese_Swanson"
-    ),
-    _("swartz"): _(
-        "Aaron Swartz was influential in creating RSS, Markdown, Creative Commons, Reddit, and much of the internet as we know it today. He was devoted to freedom of information on the web. https://en.wikiquote.org/wiki/Aaron_Swartz"
-    ),
-    _("swirles"): _(
-        "Bertha Swirles was a theoretical physicist who made a number of contributions to early quantum theory. https://en.wikipedia.org/wiki/Bertha_Swirles"
-    ),
-    _("taussig"): _(
-        "Helen Brooke Taussig - American cardiologist and founder of the field of paediatric cardiology. https://en.wikipedia.org/wiki/Helen_B._Taussig"
-    ),
-    _("tereshkova"): _(
-        "Valentina Tereshkova is a Russian engineer, cosmonaut and politician. She was the first woman to fly to space in 1963. In 2013, at the age of 76, she offered to go on a one-way mission to Mars. https://en.wikipedia.org/wiki/Valentina_Tereshkova"
-    ),
-    _("tesla"): _(
-        "Nikola Tesla invented the AC electric system and every gadget ever used by a James Bond villain. https://en.wikipedia.org/wiki/Nikola_Tesla"
-    ),
-    _("tharp"): _(
-        "Marie Tharp - American geologist and oceanic cartographer who co-created the first scientific map of the Atlantic Ocean floor. Her work led to the acceptance of the theories of plate tectonics and continental drift. https://en.wikipedia.org/wiki/Marie_Tharp"
-    ),
-    _("thompson"): _(
-        "Ken Thompson - co-creator of UNIX and the C programming language - https://en.wikipedia.org/wiki/Ken_Thompson"
-    ),
-    _("torvalds"): _(
-        "Linus Torvalds invented Linux and Git. https://en.wikipedia.org/wiki/Linus_Torvalds"
-    ),
-    _("tu"): _(
-        "Youyou Tu - Chinese pharmaceutical chemist and educator known for discovering artemisinin and dihydroartemisinin, used to treat malaria, which has saved millions of lives. Joint winner of the 2015 Nobel Prize in Physiology or Medicine. https://en.wikipedia.org/wiki/Tu_Youyou"
-    ),
-    _("turing"): _(
-        "Alan Turing was a founding father of computer science. https://en.wikipedia.org/wiki/Alan_Turing."
-    ),
-    _("varahamihira"): _(
-        "Varahamihira - Ancient Indian mathematician who discovered trigonometric formulae during 505-587 CE - https://en.wikipedia.org/wiki/Var%C4%81hamihira#Contributions"
-    ),
-    _("vaughan"): _(
-        "Dorothy Vaughan was a NASA mathematician and computer programmer on the SCOUT launch vehicle program that put America's first satellites into space - https://en.wikipedia.org/wiki/Dorothy_Vaughan"
-    ),
-    _("visvesvaraya"): _(
-        "Sir Mokshagundam Visvesvaraya - is a notable Indian engineer.  He is a recipient of the Indian Republic's highest honour, the Bharat Ratna, in 1955. On his birthday, 15 September is celebrated as Engineer's Day in India in his memory - https://en.wikipedia.org/wiki/Visvesvaraya"
-    ),
-    _("volhard"): _(
-        "Christiane Nüsslein-Volhard - German biologist, won Nobel Prize in Physiology or Medicine in 1995 for research on the genetic control of embryonic development. https://en.wikipedia.org/wiki/Christiane_N%C3%BCsslein-Volhard"
-    ),
-    _("villani"): _(
-        "Cédric Villani - French mathematician, won Fields Medal, Fermat Prize and Poincaré Price for his work in differential geometry and statistical mechanics. https://en.wikipedia.org/wiki/C%C3%A9dric_Villani"
-    ),
-    _("wescoff"): _(
-        "Marlyn Wescoff - one of the original programmers of the ENIAC. https://en.wikipedia.org/wiki/ENIAC - https://en.wikipedia.org/wiki/Marlyn_Meltzer"
-    ),
-    _("wilbur"): _(
-        "Sylvia B. Wilbur - British computer scientist who helped develop the ARPANET, was one of the first to exchange email in the UK and a leading researcher in computer-supported collaborative work. https://en.wikipedia.org/wiki/Sylvia_Wilbur"
-    ),
-    _("wiles"): _(
-        "Andrew Wiles - Notable British mathematician who proved the enigmatic Fermat's Last Theorem - https://en.wikipedia.org/wiki/Andrew_Wiles"
-    ),
-    _("williams"): _(
-        "Roberta Williams, did pioneering work in graphical adventure games for personal computers, particularly the King's Quest series. https://en.wikipedia.org/wiki/Roberta_Williams"
-    ),
-    _("williamson"): _(
-        "Malcolm John Williamson - British mathematician and cryptographer employed by the GCHQ. Developed in 1974 what is now known as Diffie-Hellman key exchange (Diffie and Hellman first published the scheme in 1976). https://en.wikipedia.org/wiki/Malcolm_J._Williamson"
-    ),
-    _("wilson"): _(
-        "Sophie Wilson designed the first Acorn Micro-Computer and the instruction set for ARM processors. https://en.wikipedia.org/wiki/Sophie_Wilson"
-    ),
-    _("wing"): _(
-        "Jeannette Wing - co-developed the Liskov substitution principle. - https://en.wikipedia.org/wiki/Jeannette_Wing"
-    ),
-    _("wozniak"): _(
-        "Steve Wozniak invented the Apple I and Apple II. https://en.wikipedia.org/wiki/Steve_Wozniak"
-    ),
-    _("wright"): _(
-        "The Wright brothers, Orville and Wilbur - credited with inventing and building the world's first successful airplane and making the first controlled, powered and sustained heavier-than-air human flight - https://en.wikipedia.org/wiki/Wright_brothers"
-    ),
-    _("wu"): _(
-        "Chien-Shiung Wu - Chinese-American experimental physicist who made significant contributions to nuclear physics. https://en.wikipedia.org/wiki/Chien-Shiung_Wu"
-    ),
-    _("yalow"): _(
-        "Rosalyn Sussman Yalow - Rosalyn Sussman Yalow was an American medical physicist, and a co-winner of the 1977 Nobel Prize in Physiology or Medicine for development of the radioimmunoassay technique. https://en.wikipedia.org/wiki/Rosalyn_Sussman_Yalow"
-    ),
-    _("yonath"): _(
-        "Ada Yonath - an Israeli crystallographer, the first woman from the Middle East to win a Nobel prize in the sciences. https://en.wikipedia.org/wiki/Ada_Yonath"
-    ),
-    _("zhukovsky"): _(
-        "Nikolay Yegorovich Zhukovsky (Russian: Никола́й Его́рович Жуко́вский, January 17 1847 – March 17, 1921) was a Russian scientist, mathematician and engineer, and a founding father of modern aero- and hydrodynamics. Whereas contemporary scientists scoffed at the idea of human flight, Zhukovsky was the first to undertake the study of airflow. He is often called the Father of Russian Aviation. https://en.wikipedia.org/wiki/Nikolay_Yegorovich_Zhukovsky"
-    ),
-}
+# equally amazing woman to it, and vice versa. Descriptions for each noun are
+# in the random_names_data module.
+NOUNS = (
+    N_("albattani"),
+    N_("allen"),
+    N_("almeida"),
+    N_("antonelli"),
+    N_("agnesi"),
+    N_("archimedes"),
+    N_("ardinghelli"),
+    N_("aryabhata"),
+    N_("austin"),
+    N_("babbage"),
+    N_("banach"),
+    N_("banzai"),
+    N_("bardeen"),
+    N_("bartik"),
+    N_("bassi"),
+    N_("beaver"),
+    N_("bell"),
+    N_("benz"),
+    N_("bhabha"),
+    N_("bhaskara"),
+    N_("black"),
+    N_("blackburn"),
+    N_("blackwell"),
+    N_("bohr"),
+    N_("booth"),
+    N_("borg"),
+    N_("bose"),
+    N_("boyd"),
+    N_("brahmagupta"),
+    N_("brattain"),
+    N_("brown"),
+    N_("buck"),
+    N_("burnell"),
+    N_("cannon"),
+    N_("carson"),
+    N_("cartwright"),
+    N_("cerf"),
+    N_("chandrasekhar"),
+    N_("chaplygin"),
+    N_("chatelet"),
+    N_("chatterjee"),
+    N_("chebyshev"),
+    N_("cohen"),
+    N_("chaum"),
+    N_("clarke"),
+    N_("colden"),
+    N_("cori"),
+    N_("cray"),
+    N_("curran"),
+    N_("curie"),
+    N_("darwin"),
+    N_("davinci"),
+    N_("dewdney"),
+    N_("dhawan"),
+    N_("diffie"),
+    N_("dijkstra"),
+    N_("dirac"),
+    N_("driscoll"),
+    N_("dubinsky"),
+    N_("easley"),
+    N_("edison"),
+    N_("einstein"),
+    N_("elbakyan"),
+    N_("elgamal"),
+    N_("elion"),
+    N_("ellis"),
+    N_("engelbart"),
+    N_("euclid"),
+    N_("euler"),
+    N_("faraday"),
+    N_("feistel"),
+    N_("fermat"),
+    N_("fermi"),
+    N_("feynman"),
+    N_("franklin"),
+    N_("gagarin"),
+    N_("galileo"),
+    N_("galois"),
+    N_("ganguly"),
+    N_("gates"),
+    N_("gauss"),
+    N_("germain"),
+    N_("goldberg"),
+    N_("goldstine"),
+    N_("goldwasser"),
+    N_("golick"),
+    N_("goodall"),
+    N_("gould"),
+    N_("greider"),
+    N_("grothendieck"),
+    N_("haibt"),
+    N_("hamilton"),
+    N_("haslett"),
+    N_("hawking"),
+    N_("hellman"),
+    N_("heisenberg"),
+    N_("hermann"),
+    N_("herschel"),
+    N_("hertz"),
+    N_("heyrovsky"),
+    N_("hodgkin"),
+    N_("hofstadter"),
+    N_("hoover"),
+    N_("hopper"),
+    N_("hugle"),
+    N_("hypatia"),
+    N_("ishizaka"),
+    N_("jackson"),
+    N_("jang"),
+    N_("jennings"),
+    N_("jepsen"),
+    N_("johnson"),
+    N_("joliot"),
+    N_("jones"),
+    N_("kalam"),
+    N_("kapitsa"),
+    N_("kare"),
+    N_("keldysh"),
+    N_("keller"),
+    N_("kepler"),
+    N_("khayyam"),
+    N_("khorana"),
+    N_("kilby"),
+    N_("kirch"),
+    N_("knuth"),
+    N_("kowalevski"),
+    N_("lalande"),
+    N_("lamarr"),
+    N_("lamport"),
+    N_("leakey"),
+    N_("leavitt"),
+    N_("lederberg"),
+    N_("lehmann"),
+    N_("lewin"),
+    N_("lichterman"),
+    N_("liskov"),
+    N_("lovelace"),
+    N_("lumiere"),
+    N_("mahavira"),
+    N_("margulis"),
+    N_("matsumoto"),
+    N_("maxwell"),
+    N_("mayer"),
+    N_("mccarthy"),
+    N_("mcclintock"),
+    N_("mclaren"),
+    N_("mclean"),
+    N_("mcnulty"),
+    N_("mendel"),
+    N_("mendeleev"),
+    N_("meitner"),
+    N_("meninsky"),
+    N_("merkle"),
+    N_("mestorf"),
+    N_("minsky"),
+    N_("mirzakhani"),
+    N_("moore"),
+    N_("morse"),
+    N_("murdock"),
+    N_("moser"),
+    N_("napier"),
+    N_("nash"),
+    N_("neumann"),
+    N_("newton"),
+    N_("nightingale"),
+    N_("nobel"),
+    N_("noether"),
+    N_("northcutt"),
+    N_("noyce"),
+    N_("panini"),
+    N_("pare"),
+    N_("pascal"),
+    N_("pasteur"),
+    N_("payne"),
+    N_("perlman"),
+    N_("pike"),
+    N_("poincare"),
+    N_("poitras"),
+    N_("proskuriakova"),
+    N_("ptolemy"),
+    N_("raman"),
+    N_("ramanujan"),
+    N_("ride"),
+    N_("montalcini"),
+    N_("ritchie"),
+    N_("rhodes"),
+    N_("robinson"),
+    N_("roentgen"),
+    N_("rosalind"),
+    N_("rubin"),
+    N_("saha"),
+    N_("sammet"),
+    N_("sanderson"),
+    N_("shamir"),
+    N_("shannon"),
+    N_("shaw"),
+    N_("shirley"),
+    N_("shockley"),
+    N_("shtern"),
+    N_("sinoussi"),
+    N_("snyder"),
+    N_("solomon"),
+    N_("spence"),
+    N_("stallman"),
+    N_("stonebraker"),
+    N_("sutherland"),
+    N_("swanson"),
+    N_("swartz"),
+    N_("swirles"),
+    N_("taussig"),
+    N_("tereshkova"),
+    N_("tesla"),
+    N_("tharp"),
+    N_("thompson"),
+    N_("torvalds"),
+    N_("tu"),
+    N_("turing"),
+    N_("varahamihira"),
+    N_("vaughan"),
+    N_("visvesvaraya"),
+    N_("volhard"),
+    N_("villani"),
+    N_("wescoff"),
+    N_("wilbur"),
+    N_("wiles"),
+    N_("williams"),
+    N_("williamson"),
+    N_("wilson"),
+    N_("wing"),
+    N_("wozniak"),
+    N_("wright"),
+    N_("wu"),
+    N_("yalow"),
+    N_("yonath"),
+    N_("zhukovsky"),
+)
+N_ADJECTIVES = len(ADJECTIVES)
+N_NOUNS = len(NOUNS)
+N_COMBINATIONS = N_ADJECTIVES * N_NOUNS
+
+
+class _NounDescriptions(Mapping):
+    """
+    Read-only mapping from nouns to their descriptions translated on access.
+    """
+
+    def __getitem__(self, noun):
+        return get_noun_description(noun)
+
+    def __iter__(self):
+        return iter(NOUNS)
+
+    def __len__(self):
+        return N_NOUNS
+
 
-NOUNS = list(NOUN_DESCRIPTIONS)
+NOUN_DESCRIPTIONS = _NounDescriptions()
@@ -1,7 +1,22 @@
 import contextlib
 import io
+import re
+import sys
+from functools import lru_cache
 
+# Position of an uppercase letter that follows a non-uppercase character
+CAMEL_CASE_BREAK = re.compile(r"(?<=[^A-Z])(?=[A-Z])")
 
+# Position of an uppercase letter that is not the first character and does not
+# follow a dash. Used by both dash_case and snake_case.
+DASH_CASE_BREAK = re.compile(r"(?<=[^-])(?=[A-Z])")
+
+# Regexes above only know about ASCII uppercase letters. Other names are handled
+# by the (slower) str.isupper() based fallbacks.
+_is_ascii = re.compile(r"[\x00-\x7f]*\Z").match
+
+
+@lru_cache(maxsize=1024)
 def humanize_name(name):
     """
     "Humanize" camel case or Python variable name.
@@ -11,23 +26,12 @@ def humanize_name(name):
         'some name'
     """
     name = name.replace("_", " ")
-    parts = []
-    buffer = []
-    is_last_lower = False
-    for chr in name:
-        if chr.isupper():
-            if is_last_lower:
-                parts.append("".join(buffer))
-                buffer = [chr]
-            else:
-                buffer.append(chr)
-            is_last_lower = False
-        else:
-            is_last_lower = True
-            buffer.append(chr)
-
-    parts.append("".join(buffer))
-    return " ".join(parts)
+    if _is_ascii(name):
+        return CAMEL_CASE_BREAK.sub(" ", name)
+    return "".join(
+        " " + c if c.isupper() and i and not name[i - 1].isupper() else c
+        for i, c in enumerate(name)
+    )
 
 
 def plural(st):
@@ -41,7 +45,10 @@ def indent(text, indent="    "):
     """
     Indent text by the given indentation string.
     """
-    return "\n".join(indent + line for line in text.splitlines())
+    lines = text.splitlines()
+    if not lines:
+        return ""
+    return indent + ("\n" + indent).join(lines)
 
 
 def safe_repr(obj, max_length=None, repr=repr):
@@ -66,9 +73,12 @@ def first_line(st):
     """
     Extracts first line of string.
     """
-    return st.lstrip().partition("\n")[0]
+    st = st.lstrip()
+    end = st.find("\n")
+    return st if end == -1 else st[:end]
 
 
+@lru_cache(maxsize=1024)
 def dash_case(name):
     """
     Convert a camel case string to dash case.
@@ -77,21 +87,31 @@ def dash_case(name):
         >>> dash_case('SomeName')
         'some-name'
     """
-
-    letters = []
-    for c in name:
-        if c.isupper() and letters and letters[-1] != "-":
-            letters.append("-" + c.lower())
-        else:
-            letters.append(c.lower())
-    return "".join(letters).replace("_", "-")
+    if _is_ascii(name):
+        name = DASH_CASE_BREAK.sub("-", name)
+    else:
+        name = _break_before_upper(name, "-")
+    return name.lower().replace("_", "-")
 
 
+@lru_cache(maxsize=1024)
 def snake_case(name):
     """
     Convert camel case to snake case.
     """
-    return dash_case(name).replace("-", "_")
+    if _is_ascii(name):
+        name = DASH_CASE_BREAK.sub("_", name)
+    else:
+        name = _break_before_upper(name, "_")
+    return name.lower().replace("-", "_")
+
+
+def _break_before_upper(name, sep):
+    # Non-ASCII version of DASH_CASE_BREAK.sub(sep, name)
+    return "".join(
+        sep + c if c.isupper() and i and name[i - 1] != "-" else c
+        for i, c in enumerate(name)
+    )
 
 
 @contextlib.contextmanager
@@ -126,6 +146,9 @@ def redirect_output(fd=None):
     If not file descriptor is given, creates a StringIO().
     """
     fd = io.StringIO() if fd is None else fd
-    with redirect_stdout(fd):
-        with redirect_stderr(fd):
-            yield fd
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = fd
+    try:
+        yield fd
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
@@ -1,11 +1,7 @@
-import logging
-
 from django.http import HttpResponse
 
 from .utils import not_implemented, allowed_methods, method_map, middleware_chain
 
-log = logging.getLogger("django.request")
-
 
 class View:
     """
@@ -29,8 +25,9 @@ class View:
         self._method_map = method_map(self)
         if self.allowed_methods is None:
             self.allowed_methods = allowed_methods(self)
+        self._allow_header = ", ".join(m.upper() for m in self.allowed_methods)
 
-        self.middlewares = self.select_middlewares(middlewares)
+        self.middlewares = tuple(self.select_middlewares(middlewares))
         self._middleware_chain = middleware_chain(
             self.middlewares, self.request_handler
         )
@@ -79,7 +76,6 @@ class View:
         Handle responding to requests for the OPTIONS HTTP verb.
         """
         response = HttpResponse()
-        methods = map(str.upper, self.allowed_methods)
-        response["Allow"] = ", ".join(methods)
+        response["Allow"] = self._allow_header
         response["Content-Length"] = "0"
         return response
@@ -1,7 +1,10 @@
+from functools import partial
+from types import FunctionType, MappingProxyType
+from typing import Mapping
+
 from django.core.exceptions import ImproperlyConfigured
 from django.shortcuts import render
 from sidekick import lazy
-from types import FunctionType
 
 
 class TemplateMixin:
@@ -10,15 +13,16 @@ class TemplateMixin:
     """
 
     render_function: FunctionType = staticmethod(render)
-    context_extra: dict = None
+    context_extra: Mapping = MappingProxyType({})
     content_type: str = None
     response_status: int = None
     template_engine: str = None
     template_name: str = None
     template_extension: str = ".html"
-    template_names: list = property(
-        lambda self: [self.template_name] if self.template_name else []
-    )
+
+    @lazy
+    def template_names(self):
+        return [self.template_name] if self.template_name else []
 
     @lazy
     def view_name(self):
@@ -28,18 +32,15 @@ class TemplateMixin:
         # TODO: snake case!
         return class_name.lower()
 
-    def get_template_names(self, request, **kwargs):
-        """
-        Return a list of template names to look for when rendering the
-        template.
-        """
+    @lazy
+    def _resolved_template_names(self):
         names = self.template_names
         if names:
             return names
 
         # If no template is given, try to infer it from the model
         model = getattr(self, "model", None)
-        if model is None:
+        if model is not None:
             app_label = model._meta.app_label
             ext = self.template_extension
             return [f"{app_label}/{self.view_name}{ext}"]
@@ -50,6 +51,15 @@ class TemplateMixin:
             "'template_name' or an implementation of 'get_template_names()'"
         )
 
+    def get_template_names(self, request, **kwargs):
+        """
+        Return a list of template names to look for when rendering the
+        template.
+
+        Names do not depend on the request and are computed only once.
+        """
+        return self._resolved_template_names
+
     def get_context(self, request, **kwargs):
         """
         Create context dictionary.
@@ -58,11 +68,8 @@ class TemplateMixin:
         variable pointing to the current view and the "view_args" pointing
         to a dictionary with the arguments passed to the view function.
         """
-        result = dict(self.context_extra or ())
-        result["view"] = self
-        result["view_args"] = kwargs
-        result.update(kwargs)
-        return result
+        extra = self.context_extra or {}
+        return {**extra, "view": self, "view_args": kwargs, **kwargs}
 
     def render(self, request, **kwargs):
         """
@@ -86,11 +93,13 @@ class TemplateMixin:
         def middleware(request):
             kwargs = request.view_args
             request.context = self.get_context(request, **kwargs)
-            request.render = lambda: self.render(request, **kwargs)
+            request.render = partial(self.render, request, **kwargs)
 
             # We expect a null response or an error. If response is null, we
             # construct our own
             response = next_middleware(request)
-            return request.render() if response is None else response
+            if response is None:
+                return self.render(request, **kwargs)
+            return response
 
         return middleware
@@ -1,4 +1,5 @@
 import functools
+import logging
 
 from django.conf import settings
 from django.core.exceptions import MiddlewareNotUsed, ImproperlyConfigured
@@ -6,12 +7,14 @@ from django.core.handlers.exception import (
     get_exception_response,
     response_for_exception,
 )
+from django.http import HttpResponseNotAllowed
 from django.urls import get_resolver, get_urlconf
 from django.utils.module_loading import import_string
 
-from boogie.views.base import log
 from .middleware import BOOGIE_VIEW_MIDDLEWARES
 
+log = logging.getLogger("django.request")
+
 
 def not_implemented(request, **kwargs):
     raise NotImplementedError
@@ -21,32 +24,70 @@ def allowed_methods(view):
     """
     Return the default list of allowed HTTP methods for the view.
     """
-    cls = type(view)
     all_methods = ["get", "post", "delete", "put"]
-    implemented = (
-        attr for attr in all_methods if getattr(cls, attr) is not not_implemented
-    )
+    implemented = (attr for attr in all_methods if is_implemented(view, attr))
     return ["options", *implemented]
 
 
+def is_implemented(view, name):
+    """
+    Return True if the view implements the given HTTP method either in its
+    class or as an instance attribute.
+    """
+    method = getattr(view, name, not_implemented)
+    return getattr(method, "__func__", method) is not not_implemented
+
+
 def method_map(view):
     """
     Return a dictionary mapping HTTP method names to their corresponding
     view functions.
+
+    Only implemented methods are included. Other methods are mapped to a
+    handler that returns a 405 (Method Not Allowed) response.
     """
-    wrapper = view.wrap_method
-    return dict(
-        GET=wrapper(getattr(view, "get", not_implemented)),
-        POST=wrapper(getattr(view, "post", not_implemented)),
-        DELETE=wrapper(getattr(view, "delete", not_implemented)),
-        PUT=wrapper(getattr(view, "put", not_implemented)),
-        OPTIONS=wrapper(getattr(view, "options", not_implemented)),
-    )
+    from .base import View
+
+    cls = type(view)
+    methods = MethodMap(view)
+    for name in ("get", "post", "delete", "put"):
+        if is_implemented(view, name):
+            methods[name.upper()] = getattr(view, name)
+    methods["OPTIONS"] = getattr(view, "options", not_implemented)
+
+    # The default wrap_method() is the identity function
+    if getattr(cls, "wrap_method", None) is not View.wrap_method:
+        for name, method in methods.items():
+            methods[name] = view.wrap_method(method)
+    return methods
+
+
+class MethodMap(dict):
+    """
+    Dictionary returned by :func:`method_map`.
+    """
+
+    def __init__(self, view):
+        super().__init__()
+        self.view = view
+
+    def __missing__(self, method):
+        return self.not_allowed
+
+    def not_allowed(self, request, **kwargs):
+        log.warning(
+            f"Method Not Allowed ({request.method}): {request.path}",
+            extra={"status_code": 405, "request": request},
+        )
+        return HttpResponseNotAllowed([m.upper() for m in self.view.allowed_methods])
 
 
 def middleware_chain(middleware_list, handler):
     """
     Reduces the middleware chain into a single handler.
+
+    Each layer converts exceptions into responses, so middlewares always see
+    errors raised by the inner layers as regular responses.
     """
 
     handler = safe_handler(handler)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.http import (
@@ -6,11 +8,14 @@ from django.http import (
     HttpResponseGone,
     Http404,
 )
-from django.urls import reverse
-from django.utils.translation import ugettext as _
+from django.urls import get_resolver, get_script_prefix, get_urlconf, reverse
+from django.utils import functional
+from django.utils.translation import get_language, ugettext as _
+from sidekick import lazy
 
-from boogie.views.base import View, log
+from boogie.views.base import View
 from boogie.views.mixins import TemplateMixin
+from boogie.views.utils import log
 
 
 class RedirectView(View):
@@ -23,26 +28,37 @@ class RedirectView(View):
     pattern_name = None
     query_string = False
 
+    @lazy
+    def _static_url(self):
+        # Urls without replacement fields do not need to be formatted
+        url = self.url
+        if url and "{" not in url and "}" not in url:
+            return url
+        return None
+
     def get_redirect_url(self, request, **kwargs):
         """
         Return the URL redirect to. Keyword arguments from the URL pattern
         match generating the redirect request are provided as kwargs to this
         method.
         """
-        if self.url:
+        if self._static_url is not None:
+            url = self._static_url
+        elif self.url:
             url = self.url.format(**kwargs)
         elif self.pattern_name:
-            url = reverse(self.pattern_name, kwargs=kwargs)
+            url = cached_reverse(self.pattern_name, kwargs)
         else:
             return None
 
-        query_args = request.META.get("QUERY_STRING", "")
-        if query_args and self.query_string:
-            url = f"{url}?{query_args}"
+        if self.query_string:
+            query_args = request.META.get("QUERY_STRING", "")
+            if query_args:
+                url = f"{url}?{query_args}"
         return url
 
     def get(self, request, *args, **kwargs):
-        url = self.get_redirect_url(*args, **kwargs)
+        url = self.get_redirect_url(request, *args, **kwargs)
         if url:
             if self.permanent:
                 return HttpResponsePermanentRedirect(url)
@@ -57,9 +73,56 @@ class RedirectView(View):
     head = post = options = delete = put = patch = get
 
 
+def cached_reverse(pattern_name, kwargs):
+    """
+    Like reverse(pattern_name, kwargs=kwargs), but memoize results.
+
+    The current url resolver, script prefix and language are part of the cache
+    key. Resolvers are recreated by clear_url_caches() (e.g., when ROOT_URLCONF
+    changes), which invalidates all previous entries.
+    """
+    try:
+        key = tuple(sorted(kwargs.items()))
+        hash(key)
+    except TypeError:
+        # Unhashable arguments
+        return reverse(pattern_name, kwargs=kwargs)
+    urlconf = get_urlconf()
+    resolver = get_resolver(urlconf)
+    prefix = get_script_prefix()
+    return _cached_reverse(
+        pattern_name, key, urlconf, resolver, prefix, get_language()
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_reverse(pattern_name, kwargs, urlconf, resolver, prefix, language):
+    return reverse(pattern_name, kwargs=dict(kwargs), urlconf=urlconf)
+
+
+def _not_found_message(model):
+    return _("No %(verbose_name)s found matching the query") % {
+        "verbose_name": model._meta.verbose_name
+    }
+
+
+# Messages are only translated if the error is rendered.
+not_found_message = functional.lazy(_not_found_message, str)
+
+
 class DetailView(TemplateMixin, View):
     """
     Provide the ability to retrieve a single object for further manipulation.
+
+    Related objects used by the template can be fetched together with the
+    object by listing them in select_related (foreign keys and one-to-one
+    relations) and prefetch_related (many-to-many and reverse foreign keys).
+    Prefetch() objects can be used to control the queryset of each prefetched
+    relation.
+
+    If fields is given, only those columns (and the relations listed in
+    select_related) are loaded from the database. The remaining fields are
+    deferred and fetched on first access.
     """
 
     model = None
@@ -69,6 +132,9 @@ class DetailView(TemplateMixin, View):
     slug_url_kwarg = "slug"
     pk_url_kwarg = "pk"
     query_pk_and_slug = False
+    select_related = ()
+    prefetch_related = ()
+    fields = None
 
     def get_queryset(self, request, **kwargs):
         """
@@ -77,16 +143,25 @@ class DetailView(TemplateMixin, View):
         This method is called by the default implementation of get_object() and
         may not be called if get_object() is overridden.
         """
-        if self.queryset is None:
-            if self.model:
-                return self.model._default_manager.all()
-            else:
-                raise ImproperlyConfigured(
-                    "%(cls)s is missing a QuerySet. Define "
-                    "%(cls)s.model, %(cls)s.queryset, or override "
-                    "%(cls)s.get_queryset()." % {"cls": self.__class__.__name__}
-                )
-        return self.queryset.all()
+        if self.queryset is not None:
+            queryset = self.queryset.all()
+        elif self.model:
+            queryset = self.model._default_manager.all()
+        else:
+            raise ImproperlyConfigured(
+                "%(cls)s is missing a QuerySet. Define "
+                "%(cls)s.model, %(cls)s.queryset, or override "
+                "%(cls)s.get_queryset()." % {"cls": self.__class__.__name__}
+            )
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.fields is not None:
+            # Relations fetched with select_related cannot be deferred
+            queryset = queryset.only(*self.fields, *self.select_related)
+        return queryset
 
     def get_object(self, request, **kwargs):
         """
@@ -98,22 +173,18 @@ class DetailView(TemplateMixin, View):
         # Use a custom queryset if provided; this is required for subclasses
         # like DateDetailView
         queryset = self.get_queryset(request, **kwargs)
-        if queryset is None:
-            queryset = self.get_queryset()
 
-        # Next, try looking up by primary key.
+        # Look up by primary key and/or slug with a single get() call.
         pk = kwargs.get(self.pk_url_kwarg)
         slug = kwargs.get(self.slug_url_kwarg)
+        lookup = {}
         if pk is not None:
-            queryset = queryset.filter(pk=pk)
-
-        # Next, try looking up by slug.
+            lookup["pk"] = pk
         if slug is not None and (pk is None or self.query_pk_and_slug):
-            slug_field = self.get_slug_field()
-            queryset = queryset.filter(**{slug_field: slug})
+            lookup[self.get_slug_field()] = slug
 
         # If none of those are defined, it's an error.
-        if pk is None and slug is None:
+        if not lookup:
             raise AttributeError(
                 "Generic detail view %s must be called with "
                 "either an object pk or a slug." % self.__class__.__name__
@@ -121,12 +192,9 @@ class DetailView(TemplateMixin, View):
 
         try:
             # Get the single item from the filtered queryset
-            obj = queryset.get()
+            obj = queryset.get(**lookup)
         except queryset.model.DoesNotExist:
-            raise Http404(
-                _("No %(verbose_name)s found matching the query")
-                % {"verbose_name": queryset.model._meta.verbose_name}
-            )
+            raise Http404(not_found_message(queryset.model))
         return obj
 
     def get_slug_field(self):
@@ -142,21 +210,21 @@ class DetailView(TemplateMixin, View):
         else:
             return None
 
-    def get_context_data(self, **kwargs):
+    def get_context_data(self, object=None, **kwargs):
         """Insert the single object into the context dict."""
         context = {}
-        if self.object:
-            context["object"] = self.object
-            context_object_name = self.get_context_object_name(self.object)
+        if object is not None:
+            context["object"] = object
+            context_object_name = self.get_context_object_name(object)
             if context_object_name:
-                context[context_object_name] = self.object
+                context[context_object_name] = object
         context.update(kwargs)
-        return super().get_context_data(**context)
+        return context
 
     def get(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        context = self.get_context_data(object=self.object)
-        return self.render(context)
+        obj = self.get_object(request, **kwargs)
+        context = self.get_context_data(object=obj)
+        return self.render(request, **{**kwargs, **context})
 
     template_name_field = None
     template_name_suffix = "_detail"
@@ -171,6 +239,10 @@ class DetailView(TemplateMixin, View):
           object instance that the view is operating upon (if available)
         * ``<app_label>/<model_name><template_name_suffix>.html``
         """
+        names = self._default_template_names
+        if names is not None:
+            return names
+
         try:
             names = super().get_template_names(request, **kwargs)
         except ImproperlyConfigured:
@@ -209,5 +281,15 @@ class DetailView(TemplateMixin, View):
 
         return names
 
+    @lazy
+    def _default_template_names(self):
+        # Request independent template names or None, if they must be
+        # computed from the object. It avoids raising and catching an
+        # ImproperlyConfigured error on each request.
+        try:
+            return super().get_template_names(None)
+        except ImproperlyConfigured:
+            return None
+
     def get_object_templates(self, request, **kwargs):
         return []
@@ -5,7 +5,7 @@ from boogie.experimental.colors.models import Color
 
 
 class TestColor:
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def color(self):
         return Color(name="red", hex_value="#FF0000")
 
@@ -1,9 +1,14 @@
+import sys
+
 import pytest
+from django.db import transaction
 
 from boogie.testing.factories import factory
 from tests.testapp import factories
 from tests.testapp.models import User
 
+pytest_plugins = ['pytester']
+
 
 @pytest.fixture
 def library(db):
@@ -15,6 +20,37 @@ def authors(db):
     return factories.authors()
 
 
+@pytest.fixture(scope='module')
+def authors_data(django_db_setup, django_db_blocker):
+    """
+    Create authors once per module inside a transaction that is rolled back
+    after the last test.
+    """
+    # Database access is unblocked only while creating and removing rows
+    atomic = transaction.atomic()
+    with django_db_blocker.unblock():
+        atomic.__enter__()
+        try:
+            authors = factories.authors()
+        except Exception:
+            atomic.__exit__(*sys.exc_info())
+            raise
+    yield authors
+    with django_db_blocker.unblock():
+        transaction.set_rollback(True)
+        atomic.__exit__(None, None, None)
+
+
+@pytest.fixture
+def shared_authors(authors_data, db):
+    """
+    Like authors, but share rows among all tests in the module.
+
+    Tests may change data, since each test runs in its own savepoint.
+    """
+    return authors_data
+
+
 @pytest.fixture
 def books(db):
     return factories.books()
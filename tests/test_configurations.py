@@ -1,7 +1,6 @@
 import contextlib
 import types
 
-import mock
 import pytest
 from environ import Env, sys, os
 
@@ -12,12 +11,12 @@ from boogie.configurations.descriptors import EnvDescriptor, env, env_settings
 @contextlib.contextmanager
 def environ(env=None):
     env = {} if env is None else env
+    old_environ, old_os_environ = Env.ENVIRON, os.environ
+    Env.ENVIRON = os.environ = env
     try:
-        with mock.patch.object(Env, 'ENVIRON', env):
-            with mock.patch.object(os, 'environ', env):
-                yield env
+        yield env
     finally:
-        pass
+        Env.ENVIRON, os.environ = old_environ, old_os_environ
 
 
 class TestConfWithEnv:
@@ -169,11 +168,8 @@ class TestGetterMethods:
 
 class TestDjangoSettings:
     def test_django_conf_create_minimum_configuration(self):
-        from pprint import pprint
-
         conf = DjangoConf()
         settings = conf.load_settings()
-        pprint(settings)
 
         assert {'ADMIN_URL',
                 'ALLOWED_HOSTS',
@@ -1,8 +1,15 @@
+import copy
+import pickle
+
 import pytest
 
 from boogie.utils import linear_namespace
 from boogie.utils.linear_namespace import linear_namespace_cached
 
+# Pickle finds classes by name in their module
+Point = linear_namespace('Point', ['x', 'y'])
+Point.__module__ = __name__
+
 
 class TestLinearNamespace:
     @pytest.fixture(scope='class')
@@ -41,6 +48,28 @@ class TestLinearNamespace:
         assert pt <= pt
         assert pt < [1, 3]
 
+    def test_comparison_with_tuples(self, point):
+        pt = point(1, 2)
+        assert pt == (1, 2)
+        assert pt != (1, 1)
+        assert pt < (1, 3)
+        assert pt + (3, 4) == [1, 2, 3, 4]
+
+    def test_copy(self, point):
+        pt = point(1, [2])
+        new = copy.copy(pt)
+        assert type(new) is point and new == pt
+        assert new.y is pt.y
+
+        new = copy.deepcopy(pt)
+        assert type(new) is point and new == pt
+        assert new.y is not pt.y
+
+    def test_pickle(self):
+        pt = Point(1, 2)
+        new = pickle.loads(pickle.dumps(pt))
+        assert type(new) is Point and new == pt
+
     def test_linear_namespace_mutation(self, point):
         pt = point(1, 2)
         assert pt == [1, 2]
@@ -1,15 +1,19 @@
-from sidekick import import_later
+import pytest
 
 from boogie.models import F
 
-pd = import_later('pandas')
+
+@pytest.fixture
+def authors(shared_authors):
+    return shared_authors
 
 
 class TestQuerySetIndexing:
     def test_django_slicing_still_works(self, authors):
-        assert authors[0] == authors.first()
-        assert authors[-1] == authors.last()
-        assert list(authors[0:2]) == [authors[0], authors[1]]
+        rows = list(authors.order_by('pk'))
+        assert authors[0] == rows[0]
+        assert authors[-1] == rows[-1]
+        assert list(authors[0:2]) == rows[:2]
 
     def test_simple_2d_slicing(self, authors):
         author = authors.get(pk=1)
@@ -30,12 +34,19 @@ class TestQuerySetIndexing:
         assert_equal(authors[F.age > 25, [F.name, F.age]],
                      authors.filter(age__gt=25).values_list('name', 'age'))
 
+    def test_2d_slicing_values(self, authors):
+        assert list(authors[:, ['name', 'age']]) == [
+            ('Author', None), ('Young', 18), ('Old', 80),
+        ]
+
 
 class TestPandasIntegration:
     def test_queryset_to_dataframe(self, authors):
+        pytest.importorskip('pandas')
         df = authors[:, ['name', 'age']].dataframe()
-        assert (df['name'] == ['Author', 'Young', 'Old']).all()
-        assert df['age'].equals(pd.Series([float('nan'), 18, 80], index=df.index))
+        assert list(df['name']) == ['Author', 'Young', 'Old']
+        assert list(df['age'].isnull()) == [True, False, False]
+        assert list(df['age'][1:]) == [18, 80]
 
 
 def assert_equal(qs1, qs2):
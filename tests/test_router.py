@@ -1,42 +1,34 @@
 from collections import defaultdict
 
 import pytest
+from django.core.exceptions import ImproperlyConfigured
 from pytest import raises
 
 from boogie.router import Router
 from boogie.testing.pytest import UrlTester, CrawlerTester
-from boogie.utils.text import redirect_output
 
 
 class TestRouter:
-    def test_router_pass_parameters_to_route(self):
+    def test_router_uses_default_dicts_for_lookups(self):
         router = Router(lookup_type='slug', lookup_field='title')
         assert isinstance(router.lookup_field, defaultdict)
         assert isinstance(router.lookup_type, defaultdict)
 
-        # Register route without override
         route = router.register(lambda book: None)
         assert isinstance(route.lookup_field, defaultdict)
         assert isinstance(route.lookup_type, defaultdict)
-        print(router.lookup_field)
-        print(route.lookup_field)
-        assert route.lookup_field['book'] == 'title'
-        assert route.lookup_type['book'] == 'slug'
 
-        # Override field
-        route = router.register(lambda book: None, lookup_field='author')
-        assert route.lookup_field['book'] == 'author'
-        assert route.lookup_type['book'] == 'slug'
-
-        # Override type
-        route = router.register(lambda book: None, lookup_type='str')
-        assert route.lookup_field['book'] == 'title'
-        assert route.lookup_type['book'] == 'str'
-
-        # Override type with dict
-        route = router.register(lambda book: None, lookup_type={'book': 'str'})
-        assert route.lookup_field['book'] == 'title'
-        assert route.lookup_type['book'] == 'str'
+    @pytest.mark.parametrize('kwargs, field, type', [
+        ({}, 'title', 'slug'),
+        ({'lookup_field': 'author'}, 'author', 'slug'),
+        ({'lookup_type': 'str'}, 'title', 'str'),
+        ({'lookup_type': {'book': 'str'}}, 'title', 'str'),
+    ])
+    def test_router_pass_parameters_to_route(self, kwargs, field, type):
+        router = Router(lookup_type='slug', lookup_field='title')
+        route = router.register(lambda book: None, **kwargs)
+        assert route.lookup_field['book'] == field
+        assert route.lookup_type['book'] == type
 
 
 class TestAppUrlTester(UrlTester):
@@ -52,6 +44,32 @@ class TestAppUrlTester(UrlTester):
     }
 
 
+class TestAppUrlTesterFast(TestAppUrlTester):
+    url_fast = True
+
+
+class TestAppUrlTesterThreaded(UrlTester):
+    paths = {
+        None: ['/hello/'],
+        'user': ['/private/?page=%s' % n for n in range(4)],
+    }
+    url_workers = 2
+
+    @pytest.fixture
+    def data(self, transactional_db):
+        return None
+
+
+class TestAppUrlTesterThreadedWithoutCommit(TestAppUrlTesterThreaded):
+    @pytest.fixture
+    def data(self, db):
+        return None
+
+    def test_urls(self, request, client, data):
+        with raises(ImproperlyConfigured):
+            super().test_urls(request, client, data)
+
+
 class TestAppUrlTesterFailure(UrlTester):
     paths = {
         None: [
@@ -71,11 +89,10 @@ class TestAppUrlTesterFailure(UrlTester):
             request.getfixturevalue('admin')
 
     @pytest.mark.django_db
-    def test_urls(self, request, client, data):
+    def test_urls(self, request, client, data, capsys):
         with raises(AssertionError) as exc:
-            with redirect_output() as out:
-                super().test_urls(request, client, data)
-        assert out.getvalue() == (
+            super().test_urls(request, client, data)
+        assert capsys.readouterr().out == (
             'Error fetching /invalid/, invalid response: 404\n'
             'Error fetching /bad/, invalid response: 404\n'
         )
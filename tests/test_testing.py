@@ -0,0 +1,138 @@
+import os
+from importlib import import_module
+
+import factory
+import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+
+from boogie.testing.client import Client
+from boogie.testing.factories import explicit_declaration, has_no_args
+from boogie.testing.pytest import UserFixtures
+from boogie.testing.urlchecker import UrlChecker
+import tests
+from tests.testapp.models import User
+
+PRIVATE_URLS = ['/private/?page=%s' % n for n in range(4)]
+
+
+class Callable:
+    def __call__(self, obj):
+        return obj
+
+    def method(self):
+        return 42
+
+
+class TestFactories:
+    def test_has_no_args(self):
+        assert has_no_args(lambda: 42)
+        assert not has_no_args(lambda obj: obj)
+        assert has_no_args(Callable().method)
+        assert not has_no_args(Callable())
+
+    def test_explicit_declaration_chooses_lazy_function_or_attribute(self):
+        decl = explicit_declaration(User, 'name', lambda: 'Author')
+        assert isinstance(decl, factory.LazyFunction)
+
+        decl = explicit_declaration(User, 'name', lambda obj: obj.name)
+        assert isinstance(decl, factory.LazyAttribute)
+
+    def test_explicit_declaration_keeps_declarations(self):
+        decl = factory.LazyFunction(lambda: 'Author')
+        assert explicit_declaration(User, 'name', decl) is decl
+
+
+class TestUrlChecker:
+    @pytest.fixture
+    def user(self, db):
+        return get_user_model().objects.create_user('user')
+
+    def session_key(self, checker):
+        return checker.client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def test_login_restores_session(self, user):
+        checker = UrlChecker({}, {})
+        checker.login(user)
+        key = self.session_key(checker)
+        checker.logout()
+        assert checker.client.get('/private/').status_code == 302
+
+        checker.login(user)
+        assert self.session_key(checker) == key
+        assert checker.client.get('/private/').status_code == 200
+
+    def test_login_recreates_deleted_session(self, user):
+        checker = UrlChecker({}, {})
+        checker.login(user)
+        key = self.session_key(checker)
+        checker.logout()
+        import_module(settings.SESSION_ENGINE).SessionStore(key).delete()
+
+        checker.login(user)
+        assert self.session_key(checker) != key
+        assert checker.client.get('/private/').status_code == 200
+
+    @pytest.mark.django_db(transaction=True)
+    def test_workers_share_login(self, user):
+        checker = UrlChecker({}, {}, workers=2)
+        checker.login(user)
+        assert checker.collect_errors(PRIVATE_URLS, {200}) == {}
+
+    def test_workers_require_committed_data(self, user):
+        checker = UrlChecker({}, {}, workers=2)
+        checker.login(user)
+        with pytest.raises(ImproperlyConfigured):
+            checker.collect_errors(PRIVATE_URLS, {200})
+
+
+class TestUserFixtures(UserFixtures):
+    class CustomClient(Client):
+        pass
+
+    @pytest.fixture
+    def client(self, db):
+        return self.CustomClient(HTTP_HOST='example.com')
+
+    def test_user_client_is_built_from_client(self, client, user_client):
+        assert user_client is not client
+        assert type(user_client) is self.CustomClient
+        assert user_client.defaults == {'HTTP_HOST': 'example.com'}
+        assert '_auth_user_id' in user_client.session
+        assert '_auth_user_id' not in client.session
+
+
+class TestPlugin:
+    def test_fast_db_keeps_database_options(self, testdir, monkeypatch):
+        root = os.path.dirname(os.path.dirname(tests.__file__))
+        path = os.pathsep.join([str(testdir.tmpdir), root, os.path.join(root, 'src')])
+        monkeypatch.setenv('PYTHONPATH', path)
+        monkeypatch.setenv('DJANGO_SETTINGS_MODULE', 'fast_settings')
+        monkeypatch.setenv('BOOGIE_FAST_DB', 'true')
+        testdir.makepyfile(fast_settings="""
+            from tests.testproject.settings import *
+
+            DATABASES = {
+                'default': {
+                    'ENGINE': 'django.db.backends.sqlite3',
+                    'NAME': 'boogie.sqlite3',
+                    'ATOMIC_REQUESTS': True,
+                    'OPTIONS': {'timeout': 30},
+                    'TEST': {'CHARSET': 'UTF8'},
+                }
+            }
+        """)
+        testdir.makepyfile("""
+            from django.conf import settings
+
+            def test_settings():
+                db = settings.DATABASES['default']
+                assert db['ENGINE'] == 'django.db.backends.sqlite3'
+                assert db['NAME'] == ':memory:'
+                assert db['ATOMIC_REQUESTS'] is True
+                assert db['OPTIONS'] == {'timeout': 30}
+                assert db['TEST']['CHARSET'] == 'UTF8'
+        """)
+        result = testdir.runpytest_subprocess('-p', 'boogie.testing.plugin')
+        result.assert_outcomes(passed=1)
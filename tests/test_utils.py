@@ -1,6 +1,8 @@
 import pytest
 
 from boogie.models.utils import LazyMethod
+from boogie.utils.params import Params
+from boogie.utils.random_names import ADJECTIVES, NOUNS, random_name, random_names
 from boogie.utils.text import humanize_name, plural, indent, safe_repr, snake_case, dash_case, first_line
 
 
@@ -16,17 +18,64 @@ class TestLazyMethod:
         assert d == {'answer': 42}
 
 
+class TestParams:
+    def test_call_overrides_local_params(self):
+        params = Params('test-params', {'a': 1}, {'b': 2})
+        new = params(a=3)
+        assert dict(new) == {'a': 3, 'b': 2}
+        assert dict(params) == {'a': 1, 'b': 2}
+
+
+class TestRandomNames:
+    def test_random_name(self):
+        adjective, noun = random_name().split()
+        assert adjective.istitle() and noun.istitle()
+
+    def test_random_names(self):
+        names = random_names(5)
+        assert len(names) == 5
+        assert all(len(name.split()) == 2 for name in names)
+
+    def test_random_name_with_custom_format(self):
+        words = random_name('the {noun} is {adjective}!').split()
+        assert words[0] == 'The' and words[2] == 'Is'
+        assert words[3].endswith('!')
+        assert all(name.startswith('X ') for name in random_names(3, 'x {noun}'))
+
+    def test_words_are_unique_plain_strings(self):
+        for words in (ADJECTIVES, NOUNS):
+            assert all(type(word) is str for word in words)
+            assert len(set(words)) == len(words)
+
+    def test_all_nouns_have_descriptions(self):
+        from boogie.utils.random_names_data import NOUN_DESCRIPTIONS
+
+        assert set(NOUN_DESCRIPTIONS) == set(NOUNS)
+
+
 class TestTextFunctions:
-    def test_text_functions(self):
-        assert humanize_name('SomeName') == 'Some Name'
-        assert humanize_name('some_name') == 'some name'
-        assert dash_case('foo_bar') == 'foo-bar'
-        assert snake_case('foo-bar') == 'foo_bar'
-        assert dash_case('fooBar') == 'foo-bar'
-        assert snake_case('fooBar') == 'foo_bar'
-        assert plural('foo bar') == 'foo bars'
+    @pytest.mark.parametrize('func, arg, expected', [
+        (humanize_name, 'SomeName', 'Some Name'),
+        (humanize_name, 'some_name', 'some name'),
+        (dash_case, 'foo_bar', 'foo-bar'),
+        (snake_case, 'foo-bar', 'foo_bar'),
+        (dash_case, 'fooBar', 'foo-bar'),
+        (snake_case, 'fooBar', 'foo_bar'),
+        (plural, 'foo bar', 'foo bars'),
+        (first_line, 'foo\nbar', 'foo'),
+        (humanize_name, 'aÉ', 'a É'),
+        (dash_case, 'aÉ', 'a-é'),
+        (snake_case, 'aÉ', 'a_é'),
+    ])
+    def test_text_functions(self, func, arg, expected):
+        assert func(arg) == expected
+
+    def test_indent(self):
         assert indent('foo\nbar') == '    foo\n    bar'
-        assert first_line('foo\nbar') == 'foo'
+        assert indent('foo\n') == '    foo'
+        assert indent('foo\r\nbar\rbaz') == '    foo\n    bar\n    baz'
+        assert indent('foo\n\nbar') == '    foo\n    \n    bar'
+        assert indent('') == ''
 
     def test_safe_repr(self):
         assert safe_repr('foo') == repr('foo')
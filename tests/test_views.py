@@ -0,0 +1,146 @@
+import types
+
+import pytest
+from django.db.models import Prefetch
+from django.conf.urls.i18n import i18n_patterns
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponse
+from django.urls import clear_url_caches, path
+
+from boogie.views.base import View
+from boogie.views.utils import middleware_chain
+from boogie.views.views import DetailView, cached_reverse
+from tests.testapp.models import Book, User
+
+
+def test_cached_reverse_respects_active_language(settings):
+    settings.USE_I18N = True
+    settings.LANGUAGES = [('en', 'English'), ('pt', 'Portuguese')]
+    urls = types.ModuleType('i18n_urls')
+    urls.urlpatterns = i18n_patterns(path('thing/<int:pk>/', lambda r: None, name='thing'))
+    settings.ROOT_URLCONF = urls
+
+    # Translation functions are bound on first use and do not follow changes
+    # to USE_I18N. Changing LANGUAGE_CODE fires setting_changed, which resets
+    # the active language with either implementation.
+    try:
+        settings.LANGUAGE_CODE = 'en'
+        assert cached_reverse('thing', {'pk': 1}) == '/en/thing/1/'
+        settings.LANGUAGE_CODE = 'pt'
+        assert cached_reverse('thing', {'pk': 1}) == '/pt/thing/1/'
+    finally:
+        clear_url_caches()
+
+
+def test_cached_reverse_follows_root_urlconf(settings):
+    urls = types.ModuleType('other_urls')
+    urls.urlpatterns = [path('other/<name>/', lambda r: None, name='hello-name')]
+    assert cached_reverse('hello-name', {'name': 'me'}) == '/hello/me/'
+
+    settings.ROOT_URLCONF = urls
+    assert cached_reverse('hello-name', {'name': 'me'}) == '/other/me/'
+
+
+def test_middleware_chain_converts_errors_in_each_layer(rf):
+    seen = []
+
+    def outer(get_response):
+        def middleware(request):
+            response = get_response(request)
+            seen.append(response.status_code)
+            return response
+        return middleware
+
+    def inner(get_response):
+        def middleware(request):
+            raise PermissionDenied
+        return middleware
+
+    handler = middleware_chain([inner, outer], lambda request: HttpResponse())
+    assert handler(rf.get('/')).status_code == 403
+    assert seen == [403]
+
+
+class TestView:
+    def test_instance_methods_are_implemented(self, rf):
+        view = View(get=lambda request: HttpResponse('ok'))
+        assert view(rf.get('/')).content == b'ok'
+        assert view.allowed_methods == ['options', 'get']
+
+    def test_not_implemented_method_is_not_allowed(self, rf):
+        view = View(get=lambda request: HttpResponse('ok'))
+        response = view(rf.post('/'))
+        assert response.status_code == 405
+        assert response['Allow'] == 'OPTIONS, GET'
+
+    def test_options_lists_class_methods(self, rf):
+        class PostView(View):
+            def post(self, request):
+                return HttpResponse('posted')
+
+        view = PostView()
+        assert view(rf.post('/')).content == b'posted'
+        assert view(rf.get('/')).status_code == 405
+        assert view(rf.options('/'))['Allow'] == 'OPTIONS, POST'
+
+
+def render_context(request, template_names, context, **kwargs):
+    response = HttpResponse()
+    response.context = context
+    return response
+
+
+class TestDetailView:
+    class UserView(DetailView):
+        model = User
+        fields = ['name']
+        prefetch_related = ['book_set']
+
+    class BookView(DetailView):
+        model = Book
+        fields = ['title']
+        select_related = ['author']
+
+    @pytest.fixture
+    def user_view(self):
+        return self.UserView(render_function=render_context)
+
+    @pytest.fixture
+    def book_view(self):
+        return self.BookView(render_function=render_context)
+
+    def test_get_renders_object(self, rf, user_view, library, django_assert_num_queries):
+        author = User.objects.get(name='Young')
+        with django_assert_num_queries(2):
+            response = user_view(rf.get('/'), pk=author.pk)
+            user = response.context['user']
+            assert response.context['object'] is user
+            assert response.context['pk'] == author.pk
+            assert sorted(book.title for book in user.book_set.all()) == [
+                'First Kindle',
+                'Second Kindle',
+            ]
+        assert user.get_deferred_fields() == {'age', 'created', 'modified', 'gender'}
+
+    def test_get_selects_related(self, rf, book_view, library, django_assert_num_queries):
+        pk = Book.objects.get(title='First Book').pk
+        with django_assert_num_queries(1):
+            book = book_view(rf.get('/'), pk=pk).context['book']
+            assert book.author.name == 'Old'
+        assert book.get_deferred_fields() == set()
+
+    def test_prefetch_objects(self, rf, library, django_assert_num_queries):
+        class View(self.UserView):
+            prefetch_related = [
+                Prefetch('book_set', Book.objects.filter(title__startswith='First')),
+            ]
+
+        pk = User.objects.get(name='Young').pk
+        view = View(render_function=render_context)
+        with django_assert_num_queries(2):
+            user = view(rf.get('/'), pk=pk).context['user']
+            assert [book.title for book in user.book_set.all()] == ['First Kindle']
+
+    def test_get_missing_object(self, rf, user_view, db):
+        with pytest.raises(Http404):
+            user_view.get(rf.get('/'), pk=1)
@@ -3,17 +3,19 @@ from rest_framework.response import Response
 from boogie.rest import rest_api
 from rest_framework.viewsets import ViewSet
 
+NUMBERS = [{'idx': i, 'value': i * i} for i in range(1, 11)]
+
 
 @rest_api.register_viewset('numbers')
 class NumbersViewSet(ViewSet):
     base_name = 'number'
 
     def list(self, request):
-        return Response([{'idx': i, 'value': i ** 2} for i in range(1, 11)])
+        return Response(NUMBERS)
 
     def retrieve(self, request, pk=None):
         i = int(pk)
-        return Response({'idx': i, 'value': i ** 2})
+        return Response({'idx': i, 'value': i * i})
 
 
 @rest_api.property('testapp.User')
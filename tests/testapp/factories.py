@@ -7,17 +7,32 @@ user_factory = factory(User)
 book_factory = factory(Book)
 
 
+# Field values shared by authors() and the single author factories. The
+# "created" entry is an offset from the time each author is created.
+AUTHORS = {
+    'author': {'name': 'Author'},
+    'young': {'name': 'Young', 'age': 18},
+    'old': {'name': 'Old', 'age': 80, 'created': timedelta(days=-1)},
+}
+
+
+def author_kwargs(name):
+    kwargs = dict(AUTHORS[name])
+    if 'created' in kwargs:
+        kwargs['created'] = now() - kwargs['created']
+    return kwargs
+
+
 def author():
-    return User.objects.create(name='Author')
+    return User.objects.create(**author_kwargs('author'))
 
 
 def young_author():
-    return User.objects.create(name='Young', age=18)
+    return User.objects.create(**author_kwargs('young'))
 
 
 def old_author():
-    return User.objects.create(name='Old', age=80,
-                               created=now() - timedelta(days=-1))
+    return User.objects.create(**author_kwargs('old'))
 
 
 def book():
@@ -25,9 +40,7 @@ def book():
 
 
 def authors():
-    author()
-    young_author()
-    old_author()
+    User.objects.bulk_create([User(**author_kwargs(name)) for name in AUTHORS])
     return User.objects
 
 
@@ -36,14 +49,12 @@ def books():
 
 
 def library():
-    book()
-
-    young = young_author()
-    Book.objects.create(title='First Kindle', author=young)
-    Book.objects.create(title='Second Kindle', author=young)
-
-    old = old_author()
-    Book.objects.create(title='First Book', author=old)
-    Book.objects.create(title='Second Book', author=old)
-
+    main, young, old = author(), young_author(), old_author()
+    Book.objects.bulk_create([
+        Book(title='Book', author_id=main.pk),
+        Book(title='First Kindle', author_id=young.pk),
+        Book(title='Second Kindle', author_id=young.pk),
+        Book(title='First Book', author_id=old.pk),
+        Book(title='Second Book', author_id=old.pk),
+    ])
     return User.objects, Book.objects
@@ -29,3 +29,8 @@ def links():
         a('hello-simple', href='/hello-simple/'),
         a('hello me', href='/hello/me/'),
     ])
+
+
+@urlpatterns.route('private/', login=True)
+def private(request):
+    return f'Hello {request.user.username}!'
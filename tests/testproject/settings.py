@@ -5,6 +5,7 @@ SECRET_KEY = 'ss68t83q^4xx2d^3!!4%ccnh1xylz^kwu3&q!ev77+kb_%b@@t'
 DEBUG = True
 ALLOWED_HOSTS = []
 AUTH_PASSWORD_VALIDATORS = []
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
 INSTALLED_APPS = [
     'tests.testapp',